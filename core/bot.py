@@ -26,6 +26,8 @@ class Bot:
         self._strategy: Optional[Any] = None
         self._started = False
         self._log = logging.getLogger(__name__)
+        # колбэки без аргументов: старт/стоп/пауза/продолжение/завершение
+        self._state_listeners: list[Callable[[], None]] = []
 
     def start(self) -> None:
         """Создать экземпляр стратегии и запустить её."""
@@ -43,7 +45,10 @@ class Bot:
                 self.on_log(f"⚠️ Ошибка при старте стратегии: {exc!r}")
 
         self._task = asyncio.create_task(self._run())
+        # уведомляем, когда задача уже done(): иначе is_running() ещё вернёт True
+        self._task.add_done_callback(lambda _task: self._notify_state())
         self._started = True
+        self._notify_state()
 
     async def _run(self) -> None:
         """Внутренний цикл исполнения стратегии."""
@@ -64,6 +69,7 @@ class Bot:
         self._call_strategy_method("stop")
         if self._task and not self._task.done():
             self._task.cancel()
+        self._notify_state()
 
     async def stop_and_wait(self) -> None:
         """Остановить стратегию и дождаться завершения задачи."""
@@ -77,10 +83,12 @@ class Bot:
     def pause(self) -> None:
         """Поставить стратегию на паузу, если она поддерживает паузу."""
         self._call_strategy_method("pause")
+        self._notify_state()
 
     def resume(self) -> None:
         """Возобновить стратегию после паузы."""
         self._call_strategy_method("resume")
+        self._notify_state()
 
     def is_running(self) -> bool:
         """Проверить, выполняется ли задача стратегии."""
@@ -90,6 +98,25 @@ class Bot:
         """Стартовал ли бот ранее."""
         return self._started
 
+    def add_state_listener(self, callback: Callable[[], None]) -> None:
+        """Подписаться на смену состояния (старт/стоп/пауза/продолжение)."""
+        if callback not in self._state_listeners:
+            self._state_listeners.append(callback)
+
+    def remove_state_listener(self, callback: Callable[[], None]) -> None:
+        """Отписаться от смены состояния."""
+        try:
+            self._state_listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _notify_state(self) -> None:
+        for callback in tuple(self._state_listeners):
+            try:
+                callback()
+            except Exception:  # noqa: BLE001
+                self._log.exception("State listener failed")
+
     @property
     def strategy(self) -> Optional[Any]:
         """Возвращает инстанс стратегии (если запущен)."""
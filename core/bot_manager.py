@@ -13,21 +13,29 @@ class BotManager:
 
     def __init__(self) -> None:
         self.bots: List[Bot] = []
+        # то же множество ботов — для проверки принадлежности за O(1)
+        self._bot_set: set[Bot] = set()
 
     def add_bot(self, bot: Bot) -> None:
         """Добавить бота в менеджер."""
         self.bots.append(bot)
+        self._bot_set.add(bot)
 
     def remove_bot(self, bot: Bot) -> None:
         """Остановить и удалить бота из менеджера."""
-        if bot in self.bots:
+        if bot in self._bot_set:
             bot.stop()
             self.bots.remove(bot)
+            self._bot_set.discard(bot)
 
     def get_all_bots(self) -> Iterable[Bot]:
         """Вернуть итератор по всем зарегистрированным ботам."""
         return list(self.bots)
 
+    def has_bot(self, bot: Bot) -> bool:
+        """Зарегистрирован ли бот в менеджере."""
+        return bot in self._bot_set
+
     def stop_all(self) -> None:
         """Остановить всех ботов."""
         loop = asyncio.get_running_loop()
@@ -35,6 +43,7 @@ class BotManager:
         for bot in list(self.bots):
             tasks.append(loop.create_task(bot.stop_and_wait()))
         self.bots.clear()
+        self._bot_set.clear()
         if tasks:
             loop.create_task(asyncio.gather(*tasks, return_exceptions=True))
 
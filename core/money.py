@@ -1,6 +1,8 @@
 # core/money.py
 from __future__ import annotations
 
+from functools import lru_cache
+
 _SYMBOLS = {
     "RUB": "₽",
     "USD": "$",
@@ -10,14 +12,41 @@ _SYMBOLS = {
 
 def format_amount(amount: float, show_plus: bool = False) -> str:
     """Возвращает строку с пробелами между тысячами и запятой в качестве разделителя."""
+    try:
+        value_q = round(amount * 100)
+    except (TypeError, ValueError, ArithmeticError):
+        # NaN/inf/нечисловое не квантуется — форматируем без кэша, как раньше
+        return _amount_text(amount, show_plus)
+    return _format_amount_cached(value_q, show_plus)
+
+
+def format_money(amount: float, code: str, *, show_plus: bool = False) -> str:
+    """1234.5, 'RUB' -> '1 234,50 ₽'; если код не знаем — '1 234,50 XXX'"""
+    # в копейках/центах: одинаковые суммы попадают в один ключ кэша
+    try:
+        value_q = round(amount * 100)
+    except (TypeError, ValueError, ArithmeticError):
+        return _with_currency(_amount_text(amount, show_plus), code)
+    return _format_money_cached(value_q, code, show_plus)
+
+
+def _amount_text(amount: float, show_plus: bool) -> str:
     s = f"{amount:,.2f}".replace(",", " ").replace(".", ",")
     if show_plus and amount > 0:
         s = "+" + s
     return s
 
 
-def format_money(amount: float, code: str, *, show_plus: bool = False) -> str:
-    """1234.5, 'RUB' -> '1 234,50 ₽'; если код не знаем — '1 234,50 XXX'"""
-    s = format_amount(amount, show_plus=show_plus)
+def _with_currency(s: str, code: str) -> str:
     sym = _SYMBOLS.get(code.upper())
     return f"{s} {sym}" if sym else f"{s} {code.upper()}"
+
+
+@lru_cache(maxsize=4096)
+def _format_amount_cached(value_q: int, show_plus: bool) -> str:
+    return _amount_text(value_q / 100, show_plus)
+
+
+@lru_cache(maxsize=8192)
+def _format_money_cached(value_q: int, code: str, show_plus: bool) -> str:
+    return _with_currency(_format_amount_cached(value_q, show_plus), code)
@@ -1,4 +1,5 @@
 import asyncio
+from functools import lru_cache
 from typing import Tuple, Optional
 
 # Лимиты ставки по валюте счёта
@@ -39,6 +40,14 @@ def normalize_sprint(symbol: str, minutes: int) -> Optional[int]:
     return m if is_sprint_allowed(symbol, m) else None
 
 
+@lru_cache(maxsize=1024)
+def _sprint_fallback(symbol: str, minutes: int) -> int:
+    """Ближайшая допустимая минута, когда normalize_sprint вернул None."""
+    if symbol == "BTCUSDT":
+        return 5
+    return 1 if minutes < 3 else max(3, min(500, minutes))
+
+
 def _clamp_open_trades(value: int) -> int:
     """Вспомогательная функция для защиты от отрицательных значений."""
     return max(0, int(value))
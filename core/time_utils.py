@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 MOSCOW_ZONE = ZoneInfo("Europe/Moscow")
@@ -28,3 +29,21 @@ def to_local_time(dt: datetime) -> datetime:
 def format_local_time(dt: datetime, fmt: str = "%d.%m.%Y %H:%M:%S") -> str:
     """Format a datetime using the local time zone."""
     return to_local_time(dt).strftime(fmt)
+
+
+def format_left(sec: float) -> str:
+    """Format a remaining wait as "1:02:03", "2:03" or "3 с"."""
+    return _format_left_secs(round(sec) if sec > 0 else 0)
+
+
+@lru_cache(maxsize=8192)
+def _format_left_secs(s: int) -> str:
+    """Cached worker for :func:`format_left`; rows ticking together share entries."""
+    if s < 60:
+        return f"{s} с"
+    if s < 3600:
+        m, s = divmod(s, 60)
+        return f"{m}:{s:02d}"
+    h, r = divmod(s, 3600)
+    m, s = divmod(r, 60)
+    return f"{h}:{m:02d}:{s:02d}"
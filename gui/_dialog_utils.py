@@ -0,0 +1,133 @@
+# gui/_dialog_utils.py
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QDialog, QDialogButtonBox, QSpinBox
+
+# таймфреймы из списка выбора -> минуты (остальное считает minutes_from_timeframe)
+TF_MINUTES: dict[str, int] = {
+    "M1": 1,
+    "M5": 5,
+    "M15": 15,
+    "M30": 30,
+    "H1": 60,
+    "H4": 240,
+    "D1": 1440,
+    "W1": 10080,
+}
+
+_OK = QDialogButtonBox.StandardButton.Ok
+_CANCEL = QDialogButtonBox.StandardButton.Cancel
+
+# иконки Ok/Cancel из текущего стиля — берём один раз (нужен уже созданный QApplication)
+_OK_ICON: QIcon | None = None
+_CANCEL_ICON: QIcon | None = None
+
+
+def make_buttonbox(parent=None) -> QDialogButtonBox:
+    """Кнопки Ok/Cancel с закэшированными иконками стиля."""
+    global _OK_ICON, _CANCEL_ICON
+    box = QDialogButtonBox(_OK | _CANCEL, parent)
+    if _OK_ICON is None:
+        _OK_ICON = box.button(_OK).icon()
+        _CANCEL_ICON = box.button(_CANCEL).icon()
+    else:
+        box.button(_OK).setIcon(_OK_ICON)
+        box.button(_CANCEL).setIcon(_CANCEL_ICON)
+    return box
+
+
+@contextmanager
+def updates_paused(widget):
+    """
+    Сборка формы пачкой: пока строки добавляются, виджет не перерисовывается,
+    раскладка и отрисовка — один раз в конце (после setLayout).
+    """
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def make_ok_cancel(dialog: QDialog) -> QDialogButtonBox:
+    """make_buttonbox, подключённый к accept/reject окна."""
+    box = make_buttonbox(dialog)
+    box.accepted.connect(dialog.accept)
+    box.rejected.connect(dialog.reject)
+    return box
+
+
+class BaseStrategyDialog(QDialog):
+    """
+    Общая основа окон настроек стратегий:
+    ленивое построение интерфейса и единая таблица диапазонов для QSpinBox.
+    """
+
+    # поле (оно же ключ params) -> ((min, max), значение по умолчанию);
+    # наследники дополняют/переопределяют своими значениями
+    SPIN_SPECS: dict[str, tuple[tuple[int, int], int]] = {
+        "base_investment": ((1, 50000), 100),
+        "max_steps": ((1, 20), 5),
+        "repeat_count": ((1, 1000), 10),
+        "min_balance": ((1, 10_000_000), 100),
+        "min_percent": ((0, 100), 70),
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        # наследник обязан уметь строить интерфейс (_ensure_ui вызывает _build_ui);
+        # проверяем при объявлении класса, а не при первом открытии окна
+        super().__init_subclass__(**kwargs)
+        if not callable(getattr(cls, "_build_ui", None)):
+            raise TypeError(f"{cls.__name__} должен определить _build_ui()")
+
+    def __init__(self, params: dict, parent=None):
+        super().__init__(parent)
+        # окно только читает params — копию не делаем
+        self._params = params
+        self._symbol = str(params.get("symbol", ""))  # прокинут из MainWindow
+        self._tf = str(params.get("timeframe", "M1"))
+        self._is_btc = self._symbol == "BTCUSDT"
+        # виджеты строятся в следующем такте цикла событий: пустое окно
+        # появляется сразу, а содержимое дорисовывается следом
+        # (или раньше — по первому get_params/accept)
+        self._built = False
+        self.setMinimumWidth(320)
+        QTimer.singleShot(0, self._deferred_build)
+
+    def _ensure_ui(self) -> None:
+        if not self._built:
+            self._built = True
+            self._build_ui()
+
+    def _deferred_build(self) -> None:
+        if not self._built:
+            self._ensure_ui()
+            # размер считался до появления виджетов — пересчитаем
+            self.adjustSize()
+
+    def accept(self):
+        # Ok мог прийти раньше отложенной сборки — get_params должен видеть виджеты
+        self._ensure_ui()
+        super().accept()
+
+    def _tf_minutes(self) -> int:
+        """Минуты текущего таймфрейма: сначала таблица, затем общий разбор строки."""
+        minutes = TF_MINUTES.get(self._tf)
+        if minutes is None:
+            from strategies.timeframe_utils import minutes_from_timeframe
+
+            minutes = minutes_from_timeframe(self._tf)
+        return minutes
+
+    def _make_spin(self, name: str) -> QSpinBox:
+        """QSpinBox для поля name по SPIN_SPECS; сохраняется в self.<name>."""
+        (lo, hi), default = self.SPIN_SPECS[name]
+        sb = QSpinBox()
+        sb.setRange(lo, hi)
+        sb.setValue(int(self._params.get(name, default)))
+        setattr(self, name, sb)
+        return sb
@@ -0,0 +1,22 @@
+# gui/_sprint.py
+from __future__ import annotations
+
+from functools import lru_cache
+
+from core.policy import normalize_sprint, _sprint_fallback
+
+
+@lru_cache(maxsize=1024)
+def resolve_minutes(symbol: str, raw: int) -> int:
+    """Минуты экспирации для сохранения: допустимое значение по policy или ближайшая замена."""
+    return int(normalize_sprint(symbol, raw) or _sprint_fallback(symbol, raw))
+
+
+def sprint_minutes(symbol: str, is_btc: bool, raw: int) -> int:
+    """
+    resolve_minutes с быстрым путём: уже допустимое значение
+    (1; 3-500, для BTCUSDT 5-500 — как в core.policy) возвращается как есть.
+    """
+    if (5 <= raw <= 500) if is_btc else (raw == 1 or 3 <= raw <= 500):
+        return raw
+    return resolve_minutes(symbol, raw)
@@ -0,0 +1,13 @@
+# gui/_strings.py
+"""Подписи полей, общие для окон настроек стратегий."""
+
+LBL_AUTO = "Авто"
+LBL_BASE_INVESTMENT = "Базовая ставка"
+LBL_MINUTES = "Время экспирации (мин)"
+LBL_MAX_STEPS = "Макс. шагов"
+LBL_REPEAT = "Повторов серии"
+LBL_MIN_BALANCE = "Мин. баланс"
+LBL_MIN_PERCENT = "Мин. процент"
+LBL_PARALLEL = "Обрабатывать множество сигналов"
+LBL_COMMON = "Общая серия для всех сигналов"
+LBL_DOUBLE = "Двойной вход на свечу"
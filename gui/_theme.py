@@ -0,0 +1,35 @@
+# gui/_theme.py
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib.util import find_spec
+
+from PyQt6.QtWidgets import QApplication
+
+
+def qdarktheme_available() -> bool:
+    """Есть ли pyqtdarktheme (без импорта самого пакета)."""
+    return find_spec("qdarktheme") is not None
+
+
+@lru_cache(maxsize=1)
+def _qdarktheme():
+    # импортируем только когда тему действительно ставят
+    try:
+        import qdarktheme
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return qdarktheme
+
+
+def apply_theme(app: QApplication, mode: str) -> None:
+    """light/dark — через qdarktheme (если есть), иначе стандартная палитра стиля."""
+    qdarktheme = _qdarktheme() if mode in ("light", "dark") else None
+    if qdarktheme is not None:
+        if hasattr(qdarktheme, "setup_theme"):
+            qdarktheme.setup_theme(mode)
+        elif hasattr(qdarktheme, "load_stylesheet"):
+            app.setStyleSheet(qdarktheme.load_stylesheet(mode))
+    else:
+        app.setPalette(app.style().standardPalette())
+        app.setStyleSheet("")
@@ -0,0 +1,143 @@
+# gui/bot_table_model.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush
+from PyQt6.QtWidgets import QPushButton
+
+
+@dataclass
+class BotRow:
+    """Отображаемое состояние одной строки таблицы ботов."""
+
+    symbol: str
+    timeframe: str
+    runtime: str = "0:00"
+    status: str = "—"
+    strategy: str = ""
+    profit: str = ""
+    account: str = ""
+    profit_fg: QBrush | None = None
+
+
+@dataclass(eq=False)
+class BotState:
+    """Учётное состояние бота в главном окне (одна запись вместо набора dict'ов)."""
+
+    row: int
+    started_at: float = 0.0
+    runtime: float = 0.0  # накопленное время работы, сек
+    last_tick: float = 0.0
+    profit: float = 0.0
+    status: str = "—"
+    last_phase: str = ""  # последняя НЕ-паузная фаза от стратегии
+    pause_btn: QPushButton | None = None
+    stop_btn: QPushButton | None = None
+    has_started_fn: Callable[[], bool] | None = None
+    is_running_fn: Callable[[], bool] | None = None
+    # последнее отрисованное (чтобы не трогать кнопки/ячейки без нужды)
+    last_started: bool | None = None
+    last_paused: bool | None = None
+    last_profit_text: str | None = None
+
+
+class BotTableModel(QAbstractTableModel):
+    """
+    Модель таблицы ботов.
+    Колонки:
+      [0] Валютная пара
+      [1] ТФ
+      [2] Время работы
+      [3] Статус
+      [4] Стратегия
+      [5] Профит
+      [6] Счёт
+      [7] Настройки     <-- виджет (setIndexWidget)
+      [8] Управление    <-- виджет (setIndexWidget)
+    """
+
+    COLS = [
+        "Валютная пара",
+        "ТФ",
+        "Время работы",
+        "Статус",
+        "Стратегия",
+        "Профит",
+        "Счёт",
+        "Настройки",
+        "Управление",
+    ]
+    COL_RUNTIME = 2
+    COL_STATUS = 3
+    COL_PROFIT = 5
+    COL_ACCOUNT = 6
+
+    # колонка -> поле BotRow (None — ячейка занята виджетом)
+    _FIELDS = (
+        "symbol",
+        "timeframe",
+        "runtime",
+        "status",
+        "strategy",
+        "profit",
+        "account",
+        None,
+        None,
+    )
+
+    def __init__(self, rows: list[BotRow] | None = None, parent=None):
+        super().__init__(parent)
+        self.rows: list[BotRow] = rows if rows is not None else []
+
+    # ---- QAbstractTableModel ----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            field = self._FIELDS[index.column()]
+            if field is None:
+                return None
+            return getattr(self.rows[index.row()], field)
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == self.COL_PROFIT:
+            return self.rows[index.row()].profit_fg
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLS[section]
+        return super().headerData(section, orientation, role)
+
+    # ---- изменение строк ----
+    def append_row(self, row: BotRow) -> int:
+        """Добавляет строку в конец и возвращает её индекс."""
+        r = len(self.rows)
+        self.beginInsertRows(QModelIndex(), r, r)
+        self.rows.append(row)
+        self.endInsertRows()
+        return r
+
+    def remove_row(self, r: int) -> None:
+        if not 0 <= r < len(self.rows):
+            return
+        self.beginRemoveRows(QModelIndex(), r, r)
+        del self.rows[r]
+        self.endRemoveRows()
+
+    def emit_changed(
+        self, first_row: int, last_row: int, first_col: int, last_col: int, roles=None
+    ) -> None:
+        """Сообщает вью об изменении прямоугольника ячеек."""
+        self.dataChanged.emit(
+            self.index(first_row, first_col),
+            self.index(last_row, last_col),
+            roles or [Qt.ItemDataRole.DisplayRole],
+        )
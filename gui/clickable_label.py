@@ -0,0 +1,15 @@
+# gui/clickable_label.py
+from __future__ import annotations
+
+from PyQt6.QtWidgets import QLabel, QAbstractButton
+
+
+class ClickableLabel(QLabel):
+    """Подпись к чекбоксу: клик по тексту переключает связанный чекбокс."""
+
+    def __init__(self, text: str, target: QAbstractButton, parent=None):
+        super().__init__(text, parent)
+        self._target = target
+
+    def mousePressEvent(self, event):
+        self._target.toggle()
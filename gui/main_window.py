@@ -7,27 +7,25 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QTextEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QMessageBox,
     QMenuBar,
     QApplication,
     QFontDialog,
 )
-from PyQt6.QtGui import QTextCursor, QColor, QFont, QMovie
-from PyQt6.QtCore import Qt, QTimer, QSize
+from PyQt6.QtGui import QTextCursor, QColor, QBrush, QFont, QMovie
+from PyQt6.QtCore import Qt, QTimer, QSize, QEvent
 from pathlib import Path
 from importlib import resources
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from collections import defaultdict
-from functools import partial
+from collections import defaultdict, deque, namedtuple
+from functools import lru_cache, partial
+from types import MappingProxyType
 import asyncio
-try:
-    import qdarktheme
-except Exception:  # pragma: no cover - optional dependency
-    qdarktheme = None
+import time
+import weakref
 
 from core.money import format_money
 from core.logger import ts
@@ -36,7 +34,9 @@ from core import config
 from gui.bot_add_dialog import AddBotDialog, ALL_SYMBOLS_LABEL
 from gui.risk_dialog import RiskDialog
 from gui.trades_table_widget import TradesTableWidget
+from gui.bot_table_model import BotRow, BotState, BotTableModel
 from gui.templates_dialog import TemplatesDialog
+from gui._theme import apply_theme, qdarktheme_available
 from core.session import (
     create_http_client_from_browser_cookies,
     refresh_http_client_cookies,
@@ -62,8 +62,60 @@ from strategies.fixed import FixedStakeStrategy
 
 DEFAULT_TIME_GIF_NAME = "u5ch1llotxtqrikuzhqeyak4odq.gif"
 
+# История сделок бота (для восстановления таблицы в StrategyControlDialog).
+# Храним компактные кортежи; dict собирается только при воспроизведении (rec._asdict()).
+TRADE_HISTORY_MAXLEN = 2048
+_PENDING_FIELDS = (
+    "trade_id",
+    "signal_at",
+    "placed_at",
+    "symbol",
+    "timeframe",
+    "direction",
+    "stake",
+    "percent",
+    "wait_seconds",
+    "account_mode",
+    "indicator",
+    "series",
+    "expected_end_ts",
+    "step",
+)
+_RESULT_FIELDS = (
+    "trade_id",
+    "signal_at",
+    "placed_at",
+    "symbol",
+    "timeframe",
+    "direction",
+    "stake",
+    "percent",
+    "profit",
+    "account_mode",
+    "indicator",
+    "series",
+    "step",
+)
+PendingRec = namedtuple("PendingRec", _PENDING_FIELDS)
+TradeRec = namedtuple("TradeRec", _RESULT_FIELDS)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_runtime_secs(s: int) -> str:
+    """Целые секунды -> «м:сс» или «ч:мм:сс» (за тик у многих ботов одно значение)."""
+    h = s // 3600
+    rem = s - h * 3600
+    m = rem // 60
+    sec = rem - m * 60
+    return f"{h}:{m:02d}:{sec:02d}" if h else f"{m}:{sec:02d}"
+
 
 class MainWindow(QWidget):
+    # цвета колонки «Профит» — создаются один раз
+    _BRUSH_POS = QBrush(QColor("green"))
+    _BRUSH_NEG = QBrush(QColor("red"))
+    _BRUSH_ZERO = QBrush(QColor("black"))
+
     def __init__(self):
         super().__init__()
 
@@ -72,17 +124,9 @@ class MainWindow(QWidget):
         font_menu = self.menu_bar.addMenu("Шрифт")
         font_menu.addAction("Выбрать...", self._choose_font)
         theme_menu = self.menu_bar.addMenu("Тема")
-        if qdarktheme:
+        if qdarktheme_available():
             def _apply_theme(mode: str) -> None:
-                app = QApplication.instance()
-                if mode in ("light", "dark"):
-                    if hasattr(qdarktheme, "setup_theme"):
-                        qdarktheme.setup_theme(mode)
-                    elif hasattr(qdarktheme, "load_stylesheet"):
-                        app.setStyleSheet(qdarktheme.load_stylesheet(mode))
-                else:
-                    app.setPalette(app.style().standardPalette())
-                    app.setStyleSheet("")
+                apply_theme(QApplication.instance(), mode)
                 config.set_theme(mode)
                 config.save_config()
 
@@ -151,10 +195,16 @@ class MainWindow(QWidget):
         self.bot_ever_started = defaultdict(bool)
         self.bot_logs = defaultdict(list)
         self.bot_log_listeners = defaultdict(list)
-        self.bot_trade_listeners = defaultdict(list)
-        self.bot_trade_history = defaultdict(list)
-        self.bot_pending_trades = defaultdict(set)
-        self.bot_last_phase: dict[Bot, str] = {}
+        # слабые ссылки: закрытые окна стратегий выпадают из подписки сами
+        self.bot_trade_listeners: dict[Bot, weakref.WeakSet] = defaultdict(
+            weakref.WeakSet
+        )
+        self.bot_trade_history = defaultdict(
+            lambda: deque(maxlen=TRADE_HISTORY_MAXLEN)
+        )
+        self.bot_pending_trades: dict[Bot, set[str]] = defaultdict(set)
+        # строки лога из частых колбэков (сигналы, сделки), выводятся пачками
+        self._log_queue: asyncio.Queue[str] = asyncio.Queue()
         self.strategy_windows: dict[Bot, "StrategyControlDialog"] = {}
 
         self.user_id_label = QLabel("user_id: loading...")
@@ -252,39 +302,24 @@ class MainWindow(QWidget):
         self.add_bot_button = QPushButton("Создать бота")
         self.add_bot_button.clicked.connect(self.show_add_bot_dialog)
 
-        self.bot_table = QTableWidget(self)
-        self.bot_table.setColumnCount(9)
-        self.bot_table.setHorizontalHeaderLabels(
-            [
-                "Валютная пара",
-                "ТФ",
-                "Время работы",
-                "Статус",
-                "Стратегия",
-                "Профит",
-                "Счёт",
-                "Настройки",
-                "Управление",
-            ]
-        )
+        self.bot_model = BotTableModel(parent=self)
+        self.bot_table = QTableView(self)
+        self.bot_table.setModel(self.bot_model)
         hdr = self.bot_table.horizontalHeader()
         hdr.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         hdr.setStretchLastSection(True)
         self.bot_table.setAlternatingRowColors(True)
         self.bot_table.setSortingEnabled(False)
-        self.bot_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.bot_table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        self.bot_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.bot_table.setSelectionMode(QTableView.SelectionMode.NoSelection)
         self.bot_table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
-        # Маппинги по ботам
-        self.bot_rows: dict[Bot, int] = {}
-        self.bot_started_at: dict[Bot, float] = {}
-        self.bot_profit = defaultdict(float)
-        self.bot_status: dict[Bot, str] = {}
-        self.bot_runtime_sec: dict[Bot, float] = defaultdict(float)
-        self.bot_last_tick: dict[Bot, float] = {}
-        self.bot_pause_buttons: dict[Bot, QPushButton] = {}
-        self.bot_stop_buttons: dict[Bot, QPushButton] = {}
+        # Состояние ботов: строка таблицы, время работы, профит, статус, кнопки
+        self.bots: dict[Bot, BotState] = {}
+        # строки, изменённые пока таблица не видна (перерисуем при показе)
+        self._pending_bot_dirty: set[int] = set()
+        # единые монотонные часы для учёта времени работы ботов
+        self._clock = time.monotonic
 
         # Тикер для апдейта "Время работы"
         self._bots_timer = QTimer(self)
@@ -326,11 +361,22 @@ class MainWindow(QWidget):
     def strategy_label(self, key: str) -> str:
         return self.strategy_labels.get(key, key)
 
+    def _bot_strategy_label(self, bot) -> str:
+        """Подпись стратегии бота; ключ стратегии не меняется — кэшируем на боте."""
+        try:
+            return bot._cached_strat_label
+        except AttributeError:
+            label = self.strategy_label(bot.strategy_kwargs.get("strategy_key", ""))
+            bot._cached_strat_label = label
+            return label
+
     # -------------------- async init --------------------
     def start_async_tasks(self):
         from core import ws_client
 
-        ws_client.signal_log_callback = self.append_to_log
+        ws_client.signal_log_callback = self._enqueue_log
+        # asyncio держит задачи по слабой ссылке — сохраняем свою
+        self._log_flush_task = asyncio.create_task(self._log_flush_loop())
         asyncio.create_task(self._init_session_and_loop())
         asyncio.create_task(listen_to_signals())
 
@@ -385,11 +431,33 @@ class MainWindow(QWidget):
 
     def append_to_log(self, text: str):
         # self.signal_log.append(str(text))
-        s = ts(str(text)) + "\n"
+        self._insert_log_block(ts(str(text)) + "\n")
+
+    def _insert_log_block(self, block: str) -> None:
         cur = self.signal_log.textCursor()
         cur.movePosition(QTextCursor.MoveOperation.Start)  # курсор в начало
         self.signal_log.setTextCursor(cur)
-        self.signal_log.insertPlainText(s)  # вставляем новую строку сверху
+        self.signal_log.insertPlainText(block)  # вставляем новые строки сверху
+
+    def _enqueue_log(self, text: str) -> None:
+        """Строка для лога из «горячих» колбэков — выводится пачкой в _log_flush_loop."""
+        self._log_queue.put_nowait(ts(str(text)))
+
+    async def _log_flush_loop(self):
+        queue = self._log_queue
+        while True:
+            lines = [await queue.get()]
+            # даём набежать пачке и выводим её одной вставкой
+            await asyncio.sleep(0.1)
+            while not queue.empty():
+                lines.append(queue.get_nowait())
+            # новые строки — сверху, как в append_to_log
+            lines.reverse()
+            try:
+                self._insert_log_block("\n".join(lines) + "\n")
+            except Exception as e:
+                # пачку теряем, но цикл живёт — иначе пропадут все следующие строки
+                print(f"[WARN] log flush failed: {e}")
 
     def _update_moscow_time(self):
         try:
@@ -534,30 +602,37 @@ class MainWindow(QWidget):
             self.bot_manager.add_bot(bot)
 
             # 5) добавляем строку в ТАБЛИЦУ ботов
-            row = self.bot_table.rowCount()
-            self.bot_table.insertRow(row)
-            self.bot_rows[bot] = row
-            self.bot_started_at[bot] = asyncio.get_running_loop().time()
-            self.bot_status[bot] = "выключен"  # до запуска
+            now = self._clock()
+            state = BotState(
+                row=-1,
+                started_at=now,
+                last_tick=now,
+                status="выключен",  # до запуска
+                has_started_fn=getattr(bot, "has_started", None) or (lambda: False),
+                is_running_fn=getattr(bot, "is_running", lambda: False),
+            )
 
             strategy_label = self.strategy_label(strategy_key)
+            bot._cached_strat_label = strategy_label
             account_txt = "ДЕМО" if self.is_demo else "РЕАЛ"
 
-            def _set(r, c, text):
-                self.bot_table.setItem(r, c, QTableWidgetItem(str(text)))
-
-            _set(row, 0, symbol)  # Пара
-            _set(row, 1, timeframe)  # ТФ
-            _set(row, 2, "0:00")  # Время работы
-            _set(row, 3, self.bot_status[bot])  # Статус
-            _set(row, 4, strategy_label)  # Стратегия
-            profit_item = QTableWidgetItem(format_money(0, self.account_currency))
-            self.bot_table.setItem(row, 5, profit_item)
-            _set(row, 6, account_txt)  # Счёт
+            row = self.bot_model.append_row(
+                BotRow(
+                    symbol=str(symbol),  # Пара
+                    timeframe=str(timeframe),  # ТФ
+                    runtime="0:00",  # Время работы
+                    status=state.status,  # Статус
+                    strategy=strategy_label,  # Стратегия
+                    profit=format_money(0, self.account_currency),  # Профит
+                    account=account_txt,  # Счёт
+                )
+            )
+            state.row = row
+            self.bots[bot] = state
 
             btn_open = QPushButton("Открыть", self)
             btn_open.clicked.connect(partial(self.open_strategy_control_dialog, bot))
-            self.bot_table.setCellWidget(row, 7, btn_open)
+            self.bot_table.setIndexWidget(self.bot_model.index(row, 7), btn_open)
 
             ctrl_widget = QWidget()
             hl = QHBoxLayout(ctrl_widget)
@@ -573,12 +648,9 @@ class MainWindow(QWidget):
             hl.addWidget(btn_pause)
             hl.addWidget(btn_stop)
             hl.addWidget(btn_del)
-            self.bot_table.setCellWidget(row, 8, ctrl_widget)
-            self.bot_pause_buttons[bot] = btn_pause
-            self.bot_stop_buttons[bot] = btn_stop
-
-            self.bot_runtime_sec[bot] = 0.0
-            self.bot_last_tick[bot] = asyncio.get_running_loop().time()
+            self.bot_table.setIndexWidget(self.bot_model.index(row, 8), ctrl_widget)
+            state.pause_btn = btn_pause
+            state.stop_btn = btn_stop
 
             self.append_to_log(
                 f"🤖 Создан бот: {strategy_label} [{symbol} {timeframe}]. Откройте настройки, чтобы запустить."
@@ -615,9 +687,11 @@ class MainWindow(QWidget):
     def stop_bot(self, bot):
         bot.stop()
         self.on_bot_finished(bot)
-        btn = self.bot_stop_buttons.get(bot)
-        if btn:
-            btn.setEnabled(False)
+        state = self.bots.get(bot)
+        if state is not None:
+            if state.stop_btn:
+                state.stop_btn.setEnabled(False)
+            state.last_started = None
 
     def toggle_pause(self, bot, paused: bool):
         has_started = getattr(bot, "has_started", None)
@@ -627,8 +701,7 @@ class MainWindow(QWidget):
             else getattr(bot, "_strategy", None) is not None
         )
 
-        key = bot.strategy_kwargs.get("strategy_key", "")
-        label = self.strategy_label(key)
+        label = self._bot_strategy_label(bot)
         sym = bot.strategy_kwargs.get("symbol")
 
         if not started:
@@ -653,18 +726,26 @@ class MainWindow(QWidget):
         st = bot.strategy
         paused = bool(st and hasattr(st, "is_paused") and st.is_paused())
         self.toggle_pause(bot, not paused)
-        btn = self.bot_pause_buttons.get(bot)
-        if btn:
-            btn.setText("⏸" if paused else "▶")
+        state = self.bots.get(bot)
+        if state is not None:
+            if state.pause_btn:
+                state.pause_btn.setText("⏸" if paused else "▶")
+            state.last_paused = None
 
     def delete_bot(self, bot):
-        row = self.bot_rows.pop(bot, None)
+        state = self.bots.pop(bot, None)
         self.bot_manager.remove_bot(bot)
-        if row is not None and 0 <= row < self.bot_table.rowCount():
-            self.bot_table.removeRow(row)
-            for b, r in list(self.bot_rows.items()):
-                if r > row:
-                    self.bot_rows[b] = r - 1
+        row = state.row if state is not None else None
+        if row is not None and 0 <= row < self.bot_model.rowCount():
+            self.bot_model.remove_row(row)
+            for other in self.bots.values():
+                if other.row > row:
+                    other.row -= 1
+            # отложенная перерисовка хранит индексы строк — сдвигаем так же
+            if self._pending_bot_dirty:
+                self._pending_bot_dirty = {
+                    r - 1 if r > row else r for r in self._pending_bot_dirty if r != row
+                }
 
         pending_ids = self.bot_pending_trades.pop(bot, set())
         for tid in pending_ids:
@@ -673,23 +754,14 @@ class MainWindow(QWidget):
             except Exception:
                 pass
         for mp in (
-            self.bot_started_at,
-            self.bot_profit,
-            self.bot_status,
-            self.bot_runtime_sec,
-            self.bot_last_tick,
-            getattr(self, "bot_last_phase", {}),
             self.bot_logs,
             self.bot_log_listeners,
             self.bot_trade_listeners,
             self.bot_trade_history,
         ):
             mp.pop(bot, None)
-        self.bot_pause_buttons.pop(bot, None)
-        self.bot_stop_buttons.pop(bot, None)
-        key = bot.strategy_kwargs.get("strategy_key", "")
         sym = bot.strategy_kwargs.get("symbol")
-        label = self.strategy_label(key)
+        label = self._bot_strategy_label(bot)
         self.append_to_log(f"× Удалён бот: {label} [{sym}]")
 
     def open_settings_dialog(self, bot):
@@ -901,7 +973,7 @@ class MainWindow(QWidget):
         acc = account_mode or ("ДЕМО" if self.is_demo else "РЕАЛ")
         tid = str(trade_id) if trade_id is not None else ""
 
-        if tid not in getattr(self.trades_table, "_row_by_trade", {}):
+        if not self.trades_table.has_trade(tid):
             # если не было pending, добавим строку с базовой информацией
             self.trades_table.add_pending(
                 trade_id=tid or "-",
@@ -924,12 +996,7 @@ class MainWindow(QWidget):
         self.trades_table.set_result(tid or "-", profit, self.account_currency)
 
     def _fmt_runtime(self, seconds: float) -> str:
-        s = int(max(0, round(seconds)))
-        h, r = divmod(s, 3600)
-        m, s = divmod(r, 60)
-        if h > 0:
-            return f"{h}:{m:02d}:{s:02d}"
-        return f"{m}:{s:02d}"
+        return _fmt_runtime_secs(int(seconds + 0.5) if seconds > 0 else 0)
 
     def _fmt_profit(self, value: float) -> str:
         try:
@@ -940,59 +1007,112 @@ class MainWindow(QWidget):
         return format_money(v, ccy, show_plus=True)
 
     def _refresh_bot_rows_runtime(self):
-        now = asyncio.get_running_loop().time()
-
-        for bot, row in list(self.bot_rows.items()):
+        now = self._clock()
+        changed_rows: list[int] = []
+        hidden = self._bot_table_hidden()
+
+        # локальные ссылки — цикл крутится каждую секунду по всем ботам
+        model_rows = self.bot_model.rows
+        row_count = len(model_rows)
+        pending_dirty = self._pending_bot_dirty
+        fmt_runtime = _fmt_runtime_secs
+
+        for bot, state in list(self.bots.items()):
+            row = state.row
             # строка могла уже быть удалена
-            if row is None or row >= self.bot_table.rowCount():
+            if row >= row_count:
                 continue
+            model_row = model_rows[row]
 
             # состояние бота/стратегии
-            has_started_fn = getattr(bot, "has_started", None)
-            started = bool(has_started_fn() if callable(has_started_fn) else False)
-            running = bool(getattr(bot, "is_running", lambda: False)())
+            started = bool(state.has_started_fn())
+            running = bool(state.is_running_fn())
             st = bot.strategy
-            paused = bool(st and hasattr(st, "is_paused") and st.is_paused())
+            is_paused_fn = getattr(st, "is_paused", None) if st else None
+            paused = bool(is_paused_fn and is_paused_fn())
 
             # === Время работы ===
-            last = self.bot_last_tick.get(bot, now)
             # накапливаем только когда реально работает и не на паузе
             if started and running and not paused:
-                self.bot_runtime_sec[bot] = self.bot_runtime_sec.get(bot, 0.0) + (
-                    now - last
-                )
+                state.runtime += now - state.last_tick
             # обновляем last_tick всегда, чтобы время не "капало" на паузе
-            self.bot_last_tick[bot] = now
+            state.last_tick = now
+
+            # окно скрыто — отрисуем при показе
+            if hidden:
+                pending_dirty.add(row)
+                continue
 
             # отрисовать время (колонка 2)
-            secs = self.bot_runtime_sec.get(bot, 0.0)
-            it_time = self.bot_table.item(row, 2)
-            if it_time is None:
-                it_time = QTableWidgetItem()
-                self.bot_table.setItem(row, 2, it_time)
-            it_time.setText(self._fmt_runtime(secs))
+            secs = state.runtime
+            model_row.runtime = fmt_runtime(int(secs + 0.5) if secs > 0 else 0)
 
             # === Статус ===
             # Если пауза — показываем "пауза", иначе последнюю фазу от стратегии (или кэш)
-            last_phase = getattr(self, "bot_last_phase", {}).get(
-                bot, None
-            ) or self.bot_status.get(bot, "—")
-            ui_status = "пауза" if paused else last_phase
-
-            it_status = self.bot_table.item(row, 3)  # колонка «Статус»
-            if it_status is None:
-                it_status = QTableWidgetItem()
-                self.bot_table.setItem(row, 3, it_status)
-            it_status.setText(ui_status)
-
-            btn = self.bot_pause_buttons.get(bot)
-            if btn:
-                btn.setEnabled(started)
-                btn.setText("▶" if paused else "⏸")
-
-            btn_stop = self.bot_stop_buttons.get(bot)
-            if btn_stop:
-                btn_stop.setEnabled(started)
+            ui_status = "пауза" if paused else (state.last_phase or state.status)
+
+            model_row.status = ui_status  # колонка «Статус»
+            changed_rows.append(row)
+
+            # кнопки трогаем только при смене состояния
+            if state.last_started != started:
+                state.last_started = started
+                if state.pause_btn:
+                    state.pause_btn.setEnabled(started)
+                if state.stop_btn:
+                    state.stop_btn.setEnabled(started)
+            if state.last_paused != paused:
+                state.last_paused = paused
+                if state.pause_btn:
+                    state.pause_btn.setText("▶" if paused else "⏸")
+
+        # одна перерисовка на весь диапазон «Время работы»..«Статус»
+        if changed_rows:
+            self._notify_bot_rows(
+                min(changed_rows),
+                max(changed_rows),
+                BotTableModel.COL_RUNTIME,
+                BotTableModel.COL_STATUS,
+            )
+
+    def _bot_table_hidden(self) -> bool:
+        return not self.bot_table.isVisible() or self.isMinimized()
+
+    def _notify_bot_rows(
+        self, first_row: int, last_row: int, first_col: int, last_col: int, roles=None
+    ) -> None:
+        """dataChanged для таблицы ботов; пока она не видна — только копим строки."""
+        if self._bot_table_hidden():
+            self._pending_bot_dirty.update(range(first_row, last_row + 1))
+            return
+        self.bot_model.emit_changed(first_row, last_row, first_col, last_col, roles)
+
+    def _flush_bot_dirty(self) -> None:
+        if not self._pending_bot_dirty or self._bot_table_hidden():
+            return
+        dirty = self._pending_bot_dirty
+        self._pending_bot_dirty = set()
+        # пересчитать время/статус и кнопки, затем одна перерисовка всего диапазона
+        self._refresh_bot_rows_runtime()
+        first = max(min(dirty), 0)
+        last = min(max(dirty), self.bot_model.rowCount() - 1)
+        if first <= last:
+            self.bot_model.emit_changed(
+                first,
+                last,
+                0,
+                BotTableModel.COL_ACCOUNT,
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole],
+            )
+
+    def showEvent(self, ev):
+        super().showEvent(ev)
+        self._flush_bot_dirty()
+
+    def changeEvent(self, ev):
+        super().changeEvent(ev)
+        if ev.type() == QEvent.Type.WindowStateChange:
+            self._flush_bot_dirty()
 
     def _set_bot_status(self, bot, status: str):
         """Колбэк от стратегии: 'ожидание сигнала' / 'делает ставку' / 'ожидание результата'.
@@ -1000,10 +1120,13 @@ class MainWindow(QWidget):
         """
         # Кэшируем последнюю НЕ-паузную фазу
         s = (status or "—").strip()
-        self.bot_last_phase[bot] = s
+        state = self.bots.get(bot)
+        if state is None:
+            return
+        state.last_phase = s
 
-        row = self.bot_rows.get(bot)
-        if row is None or row >= self.bot_table.rowCount():
+        row = state.row
+        if row >= self.bot_model.rowCount():
             return
 
         # Если бот на паузе — показываем 'пауза', иначе последнюю фазу
@@ -1012,44 +1135,51 @@ class MainWindow(QWidget):
             "пауза" if (st and hasattr(st, "is_paused") and st.is_paused()) else s
         )
 
-        it = self.bot_table.item(row, 3)  # колонка «Статус»
-        if it is None:
-            it = QTableWidgetItem()
-            self.bot_table.setItem(row, 3, it)
-        it.setText(ui_status)
+        self.bot_model.rows[row].status = ui_status  # колонка «Статус»
+        self._notify_bot_rows(
+            row, row, BotTableModel.COL_STATUS, BotTableModel.COL_STATUS
+        )
 
     def _on_bot_trade_result(self, bot, **kw):
         try:
+            state = self.bots.get(bot)
             profit = kw.get("profit", None)
-            if profit is not None:
-                self.bot_profit[bot] += float(profit)
+            if state is not None and profit is not None:
+                state.profit += float(profit)
 
             # обновим таблицу
-            row = self.bot_rows.get(bot)
-            if row is not None and row < self.bot_table.rowCount():
-                item = self.bot_table.item(row, 5)  # колонка "Профит"
-                if item is None:
-                    item = QTableWidgetItem()
-                    self.bot_table.setItem(row, 5, item)
-
-                total = self.bot_profit[bot]
+            if state is not None and state.row < self.bot_model.rowCount():
+                row = state.row
+                total = state.profit
                 cur = getattr(self, "account_currency", "RUB")
                 text = format_money(total, cur)
                 # если положительный — добавляем "+"
                 if total > 0:
                     text = "+" + text
-                    item.setForeground(QColor("green"))
+                    brush = self._BRUSH_POS
                 elif total < 0:
-                    item.setForeground(QColor("red"))
+                    brush = self._BRUSH_NEG
                 else:
-                    item.setForeground(QColor("black"))
-                item.setText(text)
+                    brush = self._BRUSH_ZERO
+                # знак и цвет однозначно следуют из текста — сравниваем только его
+                if state.last_profit_text != text:
+                    state.last_profit_text = text
+                    model_row = self.bot_model.rows[row]  # колонка "Профит"
+                    model_row.profit_fg = brush
+                    model_row.profit = text
+                    self._notify_bot_rows(
+                        row,
+                        row,
+                        BotTableModel.COL_PROFIT,
+                        BotTableModel.COL_PROFIT,
+                        [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole],
+                    )
         except Exception as e:
-            self.append_to_log(f"[!] Ошибка обновления профита: {e}")
+            self._enqueue_log(f"[!] Ошибка обновления профита: {e}")
 
         tid = str(kw.get("trade_id", ""))
         if tid:
-            self.bot_pending_trades.get(bot, set()).discard(tid)
+            self.bot_pending_trades[bot].discard(tid)
 
         indicator = kw.get("indicator")
         if not indicator:
@@ -1059,26 +1189,28 @@ class MainWindow(QWidget):
                 kw["indicator"] = indicator
 
         # дальше — обычное добавление в таблицу сделок
-        key = bot.strategy_kwargs.get("strategy_key", "")
-        strat_label = self.strategy_label(key)
+        strat_label = self._bot_strategy_label(bot)
         self.add_trade_result(**kw, strategy=strat_label)
         # кэшируем для истории
-        self.bot_trade_history[bot].append(("result", dict(kw)))
+        self.bot_trade_history[bot].append(
+            ("result", TradeRec._make(map(kw.get, _RESULT_FIELDS)))
+        )
         # 👇 уведомим всех подписчиков для этого бота (открытые StrategyControlDialog)
-        for cb in list(self.bot_trade_listeners.get(bot, [])):
-            try:
-                cb("result", kw)
-            except Exception:
-                pass
+        cbs = self.bot_trade_listeners.get(bot)
+        if cbs:
+            for cb in tuple(cbs):
+                try:
+                    cb("result", kw)
+                except Exception:
+                    pass
 
     def _on_bot_trade_pending(self, bot, **kw):
         """
         Сначала — в общую таблицу, затем — уведомляем окна стратегии ЭТОГО бота.
         Прокидываем expected_end_ts, чтобы их таймеры были синхронными.
         """
-        from time import time as _now
-
-        payload = dict(kw)
+        # kw — свежий dict этого вызова, дополняем его на месте без копий
+        payload = kw
         if not payload.get("indicator"):
             indicator = (payload.get("meta") or {}).get("indicator")
             if indicator:
@@ -1086,12 +1218,12 @@ class MainWindow(QWidget):
         wait_seconds = float(payload.get("wait_seconds", 0.0))
         expected_end_ts = payload.get("expected_end_ts")
         if expected_end_ts is None:
-            expected_end_ts = _now() + wait_seconds
+            # часы «настенные»: стратегии присылают дедлайн как epoch-время
+            expected_end_ts = time.time() + wait_seconds
         payload["expected_end_ts"] = float(expected_end_ts)
 
         # В общую (главную) таблицу
-        key = bot.strategy_kwargs.get("strategy_key", "")
-        payload["strategy"] = self.strategy_label(key)
+        payload["strategy"] = self._bot_strategy_label(bot)
         try:
             self.add_trade_pending(**payload)
         except Exception:
@@ -1102,68 +1234,72 @@ class MainWindow(QWidget):
             self.bot_pending_trades[bot].add(tid)
 
         # ⬇️ НОВОЕ: сохраняем в историю, чтобы StrategyControlDialog восстановил «ожидание»
-        self.bot_trade_history[bot].append(("pending", dict(payload)))
+        self.bot_trade_history[bot].append(
+            ("pending", PendingRec._make(map(payload.get, _PENDING_FIELDS)))
+        )
 
-        # Уведомляем открытые окна конкретного бота
-        for cb in list(self.bot_trade_listeners.get(bot, [])):
-            try:
-                cb("pending", payload)
-            except Exception:
-                pass
+        # Уведомляем открытые окна конкретного бота (только чтение, без копии)
+        cbs = self.bot_trade_listeners.get(bot)
+        if cbs:
+            view = MappingProxyType(payload)
+            for cb in tuple(cbs):
+                try:
+                    cb("pending", view)
+                except Exception:
+                    pass
 
     def on_bot_finished(self, bot):
         # Просто помечаем статус, оставляя строку в таблице — бот можно перезапустить
-        row = self.bot_rows.get(bot)
-        self.bot_status[bot] = "стратегия завершена"
-        self.bot_last_phase[bot] = "стратегия завершена"
-
-        if row is not None and 0 <= row < self.bot_table.rowCount():
-            it = self.bot_table.item(row, 3)
-            if it is None:
-                it = QTableWidgetItem()
-                self.bot_table.setItem(row, 3, it)
-            it.setText("стратегия завершена")
-
-        key = bot.strategy_kwargs.get("strategy_key", "")
-        label = self.strategy_label(key)
-        self.append_to_log(
+        state = self.bots.get(bot)
+        row = None
+        if state is not None:
+            state.status = "стратегия завершена"
+            state.last_phase = "стратегия завершена"
+            row = state.row
+
+        if row is not None and 0 <= row < self.bot_model.rowCount():
+            self.bot_model.rows[row].status = "стратегия завершена"
+            self._notify_bot_rows(
+                row, row, BotTableModel.COL_STATUS, BotTableModel.COL_STATUS
+            )
+
+        label = self._bot_strategy_label(bot)
+        self._enqueue_log(
             f"ℹ️ Бот завершил работу: {label} [{bot.strategy_kwargs.get('symbol')}]"
         )
 
     def reset_bot(self, bot):
         """Очистить состояние бота перед повторным запуском."""
-        # сбросим накопленные значения
-        self.bot_runtime_sec[bot] = 0.0
-        self.bot_profit[bot] = 0.0
-        self.bot_status[bot] = "выключен"
-        self.bot_last_phase[bot] = "выключен"
-        loop = asyncio.get_running_loop()
-        self.bot_started_at[bot] = loop.time()
-        self.bot_last_tick[bot] = loop.time()
-
-        row = self.bot_rows.get(bot)
-        if row is not None and row < self.bot_table.rowCount():
-            # время работы
-            it_time = self.bot_table.item(row, 2)
-            if it_time is None:
-                it_time = QTableWidgetItem()
-                self.bot_table.setItem(row, 2, it_time)
-            it_time.setText("0:00")
-
-            # статус
-            it_status = self.bot_table.item(row, 3)
-            if it_status is None:
-                it_status = QTableWidgetItem()
-                self.bot_table.setItem(row, 3, it_status)
-            it_status.setText("выключен")
+        bot._cached_strat_label = self.strategy_label(
+            bot.strategy_kwargs.get("strategy_key", "")
+        )
+        state = self.bots.get(bot)
+        if state is None:
+            return
 
+        # сбросим накопленные значения
+        state.runtime = 0.0
+        state.profit = 0.0
+        state.status = "выключен"
+        state.last_phase = "выключен"
+        state.started_at = state.last_tick = self._clock()
+
+        row = state.row
+        if row < self.bot_model.rowCount():
+            model_row = self.bot_model.rows[row]
+            model_row.runtime = "0:00"  # время работы
+            model_row.status = "выключен"  # статус
             # профит
-            it_profit = self.bot_table.item(row, 5)
-            if it_profit is None:
-                it_profit = QTableWidgetItem()
-                self.bot_table.setItem(row, 5, it_profit)
-            it_profit.setForeground(QColor("black"))
-            it_profit.setText(format_money(0, self.account_currency))
+            model_row.profit_fg = self._BRUSH_ZERO
+            model_row.profit = format_money(0, self.account_currency)
+            state.last_profit_text = model_row.profit
+            self._notify_bot_rows(
+                row,
+                row,
+                BotTableModel.COL_RUNTIME,
+                BotTableModel.COL_PROFIT,
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole],
+            )
 
     def _on_trade_pending_global(
         self,
@@ -1185,8 +1321,7 @@ class MainWindow(QWidget):
     ):
         strat_label = "-"
         if bot is not None:
-            key = bot.strategy_kwargs.get("strategy_key", "")
-            strat_label = self.strategy_label(key)
+            strat_label = self._bot_strategy_label(bot)
         self.add_trade_pending(
             trade_id=trade_id,
             signal_at=signal_at,
@@ -1225,8 +1360,7 @@ class MainWindow(QWidget):
     ):
         strat_label = "-"
         if bot is not None:
-            key = bot.strategy_kwargs.get("strategy_key", "")
-            strat_label = self.strategy_label(key)
+            strat_label = self._bot_strategy_label(bot)
         self.add_trade_result(
             trade_id=trade_id,
             signal_at=signal_at,
@@ -1,26 +1,34 @@
+import importlib
 from typing import Type, Dict
 from PyQt6.QtWidgets import QDialog
-from strategies.martingale import MartingaleStrategy
-from strategies.oscar_grind_1 import OscarGrind1Strategy
-from strategies.oscar_grind_2 import OscarGrind2Strategy
-from strategies.antimartin import AntiMartingaleStrategy
-from strategies.fibonacci import FibonacciStrategy
-from strategies.fixed import FixedStakeStrategy
-from gui.settings_martingale import MartingaleSettingsDialog
-from gui.settings_oscar_grind import OscarGrindSettingsDialog
-from gui.settings_antimartin import AntimartinSettingsDialog
-from gui.settings_fibonacci import FibonacciSettingsDialog
-from gui.settings_fixed import FixedSettingsDialog
 
-_registry: Dict[Type, Type[QDialog]] = {
-    MartingaleStrategy: MartingaleSettingsDialog,
-    OscarGrind1Strategy: OscarGrindSettingsDialog,
-    OscarGrind2Strategy: OscarGrindSettingsDialog,
-    AntiMartingaleStrategy: AntimartinSettingsDialog,
-    FibonacciStrategy: FibonacciSettingsDialog,
-    FixedStakeStrategy: FixedSettingsDialog,
+# "модуль:класс стратегии" -> "модуль:класс окна настроек".
+# Модули окон импортируются только при первом запросе.
+_registry: Dict[str, str] = {
+    "strategies.martingale:MartingaleStrategy": "gui.settings_martingale:MartingaleSettingsDialog",
+    "strategies.oscar_grind_1:OscarGrind1Strategy": "gui.settings_oscar_grind:OscarGrindSettingsDialog",
+    "strategies.oscar_grind_2:OscarGrind2Strategy": "gui.settings_oscar_grind:OscarGrindSettingsDialog",
+    "strategies.antimartin:AntiMartingaleStrategy": "gui.settings_antimartin:AntimartinSettingsDialog",
+    "strategies.fibonacci:FibonacciStrategy": "gui.settings_fibonacci:FibonacciSettingsDialog",
+    "strategies.fixed:FixedStakeStrategy": "gui.settings_fixed:FixedSettingsDialog",
 }
 
+# класс стратегии -> разрешённый класс окна (или None)
+_resolved: Dict[Type, Type[QDialog] | None] = {}
+
+
+def _import_attr(path: str):
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
 
 def get_settings_dialog_cls(strategy_cls: Type) -> Type[QDialog] | None:
-    return _registry.get(strategy_cls)
+    try:
+        return _resolved[strategy_cls]
+    except KeyError:
+        pass
+    key = f"{strategy_cls.__module__}:{strategy_cls.__qualname__}"
+    target = _registry.get(key)
+    dlg_cls = _import_attr(target) if target else None
+    _resolved[strategy_cls] = dlg_cls
+    return dlg_cls
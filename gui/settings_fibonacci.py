@@ -2,71 +2,78 @@ from PyQt6.QtWidgets import (
     QDialog,
     QFormLayout,
     QSpinBox,
-    QDialogButtonBox,
     QCheckBox,
     QHBoxLayout,
-    QLabel,
     QWidget,
 )
+from gui._dialog_utils import make_ok_cancel, updates_paused
+from gui.clickable_label import ClickableLabel
+from gui._strings import (
+    LBL_AUTO,
+    LBL_BASE_INVESTMENT,
+    LBL_MINUTES,
+    LBL_MAX_STEPS,
+    LBL_REPEAT,
+    LBL_MIN_BALANCE,
+    LBL_MIN_PERCENT,
+    LBL_PARALLEL,
+    LBL_COMMON,
+)
 from strategies.timeframe_utils import minutes_from_timeframe
-from core.policy import normalize_sprint
+from gui._sprint import sprint_minutes
 
 
 class FibonacciSettingsDialog(QDialog):
     def __init__(self, params: dict, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Настройки: Fibonacci")
-        self.params = params.copy()
+        self._symbol = str(params.get("symbol", ""))  # прокинут из MainWindow
+        self._tf = str(params.get("timeframe", "M1"))
+        self._is_btc = self._symbol == "BTCUSDT"
 
-        tf = str(self.params.get("timeframe", "M1"))
-        symbol = str(self.params.get("symbol", ""))
-        default_minutes = int(self.params.get("minutes", minutes_from_timeframe(tf)))
+        tf = self._tf
+        self._auto_default_minutes = minutes_from_timeframe(tf)
+        default_minutes = int(params.get("minutes", self._auto_default_minutes))
 
         self.minutes = QSpinBox()
-        self.minutes.setRange(5 if symbol == "BTCUSDT" else 1, 500)
+        self.minutes.setRange(5 if self._is_btc else 1, 500)
         self.minutes.setValue(default_minutes)
 
-        self.auto_minutes = QCheckBox("Авто")
-        self.auto_minutes.setChecked(bool(self.params.get("auto_minutes", True)))
-        self.auto_minutes.toggled.connect(
-            lambda checked: self.minutes.setEnabled(not checked)
-        )
+        self.auto_minutes = QCheckBox(LBL_AUTO)
+        self.auto_minutes.setChecked(bool(params.get("auto_minutes", True)))
+        self.auto_minutes.toggled.connect(self.minutes.setDisabled)
 
         self.base_investment = QSpinBox()
         self.base_investment.setRange(1, 50000)
-        self.base_investment.setValue(self.params.get("base_investment", 100))
+        self.base_investment.setValue(params.get("base_investment", 100))
 
         self.max_steps = QSpinBox()
         self.max_steps.setRange(1, 20)
-        self.max_steps.setValue(self.params.get("max_steps", 5))
+        self.max_steps.setValue(params.get("max_steps", 5))
 
         self.repeat_count = QSpinBox()
         self.repeat_count.setRange(1, 1000)
-        self.repeat_count.setValue(self.params.get("repeat_count", 10))
+        self.repeat_count.setValue(params.get("repeat_count", 10))
 
         self.min_balance = QSpinBox()
         self.min_balance.setRange(1, 10_000_000)
-        self.min_balance.setValue(self.params.get("min_balance", 100))
+        self.min_balance.setValue(params.get("min_balance", 100))
 
         self.min_percent = QSpinBox()
         self.min_percent.setRange(0, 100)
-        self.min_percent.setValue(self.params.get("min_percent", 70))
+        self.min_percent.setValue(params.get("min_percent", 70))
 
         self.parallel_trades = QCheckBox()
         self.parallel_trades.setChecked(
-            bool(self.params.get("allow_parallel_trades", False))
+            bool(params.get("allow_parallel_trades", False))
         )
-        parallel_label = QLabel("Обрабатывать множество сигналов")
-        parallel_label.mousePressEvent = lambda event: self.parallel_trades.toggle()
+        parallel_label = ClickableLabel(LBL_PARALLEL, self.parallel_trades)
 
         self.common_series = QCheckBox()
         self.common_series.setChecked(
-            bool(self.params.get("use_common_series", True))
-        )
-        common_series_label = QLabel("Общая серия для всех сигналов")
-        common_series_label.mousePressEvent = (
-            lambda event: self.common_series.toggle()
+            bool(params.get("use_common_series", True))
         )
+        common_series_label = ClickableLabel(LBL_COMMON, self.common_series)
 
         minutes_row = QWidget()
         minutes_layout = QHBoxLayout(minutes_row)
@@ -76,32 +83,27 @@ class FibonacciSettingsDialog(QDialog):
         minutes_layout.addWidget(self.auto_minutes)
         minutes_layout.addStretch(1)
 
-        form = QFormLayout()
-        form.addRow("Базовая ставка", self.base_investment)
-        form.addRow("Время экспирации (мин)", minutes_row)
-        form.addRow("Макс. шагов", self.max_steps)
-        form.addRow("Повторов серии", self.repeat_count)
-        form.addRow("Мин. баланс", self.min_balance)
-        form.addRow("Мин. процент", self.min_percent)
-        form.addRow(parallel_label, self.parallel_trades)
-        form.addRow(common_series_label, self.common_series)
-
-        btns = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        btns.accepted.connect(self.accept)
-        btns.rejected.connect(self.reject)
-
-        form.addRow(btns)
-        self.setLayout(form)
+        with updates_paused(self):
+            form = QFormLayout()
+            form.addRow(LBL_BASE_INVESTMENT, self.base_investment)
+            form.addRow(LBL_MINUTES, minutes_row)
+            form.addRow(LBL_MAX_STEPS, self.max_steps)
+            form.addRow(LBL_REPEAT, self.repeat_count)
+            form.addRow(LBL_MIN_BALANCE, self.min_balance)
+            form.addRow(LBL_MIN_PERCENT, self.min_percent)
+            form.addRow(parallel_label, self.parallel_trades)
+            form.addRow(common_series_label, self.common_series)
+
+            form.addRow(make_ok_cancel(self))
+            self.setLayout(form)
+        self.updateGeometry()
 
     def get_params(self) -> dict:
-        symbol = str(self.params.get("symbol", ""))
         auto_minutes = bool(self.auto_minutes.isChecked())
-        raw_minutes = minutes_from_timeframe(tf) if auto_minutes else int(self.minutes.value())
-        norm = normalize_sprint(symbol, raw_minutes)
-        if norm is None:
-            norm = 5 if symbol == "BTCUSDT" else (1 if raw_minutes < 3 else max(3, min(500, raw_minutes)))
+        raw_minutes = (
+            self._auto_default_minutes if auto_minutes else int(self.minutes.value())
+        )
+        norm = sprint_minutes(self._symbol, self._is_btc, raw_minutes)
         return {
             "minutes": int(norm),
             "auto_minutes": auto_minutes,
@@ -1,86 +1,74 @@
 # gui/settings_oscar_grind.py
 from PyQt6.QtWidgets import (
-    QDialog,
-    QFormLayout,
+    QGridLayout,
+    QLabel,
     QSpinBox,
-    QDialogButtonBox,
     QCheckBox,
     QHBoxLayout,
-    QLabel,
     QWidget,
 )
-from strategies.timeframe_utils import minutes_from_timeframe
-from core.policy import normalize_sprint
+from gui._dialog_utils import BaseStrategyDialog, make_ok_cancel, updates_paused
+from gui.clickable_label import ClickableLabel
+from gui._strings import (
+    LBL_AUTO,
+    LBL_MINUTES,
+    LBL_REPEAT,
+    LBL_MIN_BALANCE,
+    LBL_MIN_PERCENT,
+    LBL_PARALLEL,
+    LBL_COMMON,
+    LBL_DOUBLE,
+)
+from gui._sprint import sprint_minutes
+
+
+# поля QSpinBox (диапазоны — в SPIN_SPECS)
+_SPINS = ("base_investment", "max_steps", "repeat_count", "min_balance", "min_percent")
+# атрибут, ключ params, значение по умолчанию
+_CHECKS = (
+    ("double_entry", "double_entry", True),
+    ("parallel_trades", "allow_parallel_trades", False),
+    ("common_series", "use_common_series", True),
+)
 
 
-class OscarGrindSettingsDialog(QDialog):
+class OscarGrindSettingsDialog(BaseStrategyDialog):
+    SPIN_SPECS = {
+        **BaseStrategyDialog.SPIN_SPECS,
+        "max_steps": ((1, 100), 20),
+    }
+
     def __init__(self, params: dict, parent=None):
-        super().__init__(parent)
+        super().__init__(params, parent)
         self.setWindowTitle("Настройки: Oscar Grind")
-        self.params = params.copy()
 
-        tf = str(self.params.get("timeframe", "M1"))
-        symbol = str(self.params.get("symbol", ""))  # прокинут из MainWindow
+    def _build_ui(self):
+        params = self._params
 
-        default_minutes = int(self.params.get("minutes", minutes_from_timeframe(tf)))
-        base_default = int(self.params.get("base_investment", 100))
+        self._auto_default_minutes = self._tf_minutes()
+        default_minutes = int(params.get("minutes", self._auto_default_minutes))
 
         # Время экспирации
         self.minutes = QSpinBox()
-        self.minutes.setRange(5 if symbol == "BTCUSDT" else 1, 500)
+        self.minutes.setRange(5 if self._is_btc else 1, 500)
         self.minutes.setValue(default_minutes)
 
-        self.auto_minutes = QCheckBox("Авто")
-        self.auto_minutes.setChecked(bool(self.params.get("auto_minutes", True)))
-        self.auto_minutes.toggled.connect(
-            lambda checked: self.minutes.setEnabled(not checked)
-        )
-
-        # Базовая «единица» (unit)
-        self.base_investment = QSpinBox()
-        self.base_investment.setRange(1, 50000)
-        self.base_investment.setValue(base_default)
-
-
-        # Ограничители
-        self.max_steps = QSpinBox()
-        self.max_steps.setRange(1, 100)
-        self.max_steps.setValue(self.params.get("max_steps", 20))
+        self.auto_minutes = QCheckBox(LBL_AUTO)
+        self.auto_minutes.setChecked(bool(params.get("auto_minutes", True)))
+        self.auto_minutes.toggled.connect(self.minutes.setDisabled)
 
-        self.repeat_count = QSpinBox()
-        self.repeat_count.setRange(1, 1000)
-        self.repeat_count.setValue(self.params.get("repeat_count", 10))
+        # Базовая «единица» (unit), ограничители, фильтр payout
+        for name in _SPINS:
+            self._make_spin(name)
 
-        self.min_balance = QSpinBox()
-        self.min_balance.setRange(1, 10_000_000)
-        self.min_balance.setValue(self.params.get("min_balance", 100))
-
-        # Фильтр payout
-        self.min_percent = QSpinBox()
-        self.min_percent.setRange(0, 100)
-        self.min_percent.setValue(self.params.get("min_percent", 70))
-
-        # Повторный вход при поражении
-        self.double_entry = QCheckBox()
-        self.double_entry.setChecked(bool(self.params.get("double_entry", True)))
-        double_entry_label = QLabel("Двойной вход на свечу")
-        double_entry_label.mousePressEvent = lambda event: self.double_entry.toggle()
-
-        self.parallel_trades = QCheckBox()
-        self.parallel_trades.setChecked(
-            bool(self.params.get("allow_parallel_trades", False))
-        )
-        parallel_label = QLabel("Обрабатывать множество сигналов")
-        parallel_label.mousePressEvent = lambda event: self.parallel_trades.toggle()
-
-        self.common_series = QCheckBox()
-        self.common_series.setChecked(
-            bool(self.params.get("use_common_series", True))
-        )
-        common_series_label = QLabel("Общая серия для всех сигналов")
-        common_series_label.mousePressEvent = (
-            lambda event: self.common_series.toggle()
-        )
+        # Повторный вход при поражении, параллельные сигналы, общая серия
+        for name, key, default in _CHECKS:
+            cb = QCheckBox()
+            cb.setChecked(bool(params.get(key, default)))
+            setattr(self, name, cb)
+        double_entry_label = ClickableLabel(LBL_DOUBLE, self.double_entry)
+        parallel_label = ClickableLabel(LBL_PARALLEL, self.parallel_trades)
+        common_series_label = ClickableLabel(LBL_COMMON, self.common_series)
 
         minutes_row = QWidget()
         minutes_layout = QHBoxLayout(minutes_row)
@@ -90,44 +78,54 @@ class OscarGrindSettingsDialog(QDialog):
         minutes_layout.addWidget(self.auto_minutes)
         minutes_layout.addStretch(1)
 
-        form = QFormLayout()
-        form.addRow("Базовая ставка (unit)", self.base_investment)
-        form.addRow("Время экспирации (мин)", minutes_row)
-        form.addRow("Макс. сделок в серии", self.max_steps)
-        form.addRow("Повторов серии", self.repeat_count)
-        form.addRow("Мин. баланс", self.min_balance)
-        form.addRow("Мин. процент", self.min_percent)
-        form.addRow(double_entry_label, self.double_entry)
-        form.addRow(parallel_label, self.parallel_trades)
-        form.addRow(common_series_label, self.common_series)
-
-        btns = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        btns.accepted.connect(self.accept)
-        btns.rejected.connect(self.reject)
-
-        form.addRow(btns)
-        self.setLayout(form)
+        with updates_paused(self):
+            grid = QGridLayout()
+            grid.setColumnStretch(1, 1)
+            rows = [
+                ("Базовая ставка (unit)", self.base_investment),
+                (LBL_MINUTES, minutes_row),
+                ("Макс. сделок в серии", self.max_steps),
+                (LBL_REPEAT, self.repeat_count),
+                (LBL_MIN_BALANCE, self.min_balance),
+                (LBL_MIN_PERCENT, self.min_percent),
+                (double_entry_label, self.double_entry),
+                (parallel_label, self.parallel_trades),
+                (common_series_label, self.common_series),
+            ]
+            for r, (label, field) in enumerate(rows):
+                grid.addWidget(QLabel(label) if isinstance(label, str) else label, r, 0)
+                grid.addWidget(field, r, 1)
+
+            grid.addWidget(make_ok_cancel(self), len(rows), 0, 1, 2)
+            self.setLayout(grid)
+        self.updateGeometry()
 
     def get_params(self) -> dict:
+        self._ensure_ui()
         # Мягкая нормализация минут через policy
-        symbol = str(self.params.get("symbol", ""))
         auto_minutes = bool(self.auto_minutes.isChecked())
-        raw_minutes = minutes_from_timeframe(tf) if auto_minutes else int(self.minutes.value())
-        norm = normalize_sprint(symbol, raw_minutes)
-        if norm is None:
-            norm = 5 if symbol == "BTCUSDT" else (1 if raw_minutes < 3 else max(3, min(500, raw_minutes)))
-
+        raw_minutes = (
+            self._auto_default_minutes if auto_minutes else int(self.minutes.value())
+        )
+        norm = sprint_minutes(self._symbol, self._is_btc, raw_minutes)
+
+        bi = self.base_investment.value
+        ms = self.max_steps.value
+        rc = self.repeat_count.value
+        mb = self.min_balance.value
+        mp = self.min_percent.value
+        de = self.double_entry.isChecked
+        pt = self.parallel_trades.isChecked
+        cs = self.common_series.isChecked
         return {
             "minutes": int(norm),
             "auto_minutes": auto_minutes,
-            "base_investment": int(self.base_investment.value()),
-            "max_steps": int(self.max_steps.value()),
-            "repeat_count": int(self.repeat_count.value()),
-            "min_balance": int(self.min_balance.value()),
-            "min_percent": int(self.min_percent.value()),
-            "double_entry": bool(self.double_entry.isChecked()),
-            "allow_parallel_trades": bool(self.parallel_trades.isChecked()),
-            "use_common_series": bool(self.common_series.isChecked()),
+            "base_investment": int(bi()),
+            "max_steps": int(ms()),
+            "repeat_count": int(rc()),
+            "min_balance": int(mb()),
+            "min_percent": int(mp()),
+            "double_entry": bool(de()),
+            "allow_parallel_trades": bool(pt()),
+            "use_common_series": bool(cs()),
         }
@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
     QWidget,
     QGroupBox,
@@ -11,31 +11,129 @@ from PyQt6.QtWidgets import (
     QSpinBox,
     QDoubleSpinBox,
     QMessageBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QComboBox,
     QCheckBox,
     QInputDialog,
     QSizePolicy,
 )
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
+from time import time as _now
 
-from PyQt6.QtGui import QColor, QBrush, QTextCursor, QFont
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import QSignalBlocker, QTimer, Qt
+from PyQt6.QtGui import QFont, QTextCursor
 from core.money import format_amount
 from strategies.timeframe_utils import minutes_from_timeframe
 from core.policy import normalize_sprint
 from core.money import format_money
 from core.logger import ts
 from gui.bot_add_dialog import ALL_TF_LABEL
+from gui.clickable_label import ClickableLabel
+from gui.strategy_control_models import SignalQueueModel, TradesModel
 from core.templates import (
     load_templates,
     save_templates,
     load_last_template,
     save_last_template,
 )
-from core.time_utils import format_local_time
+from core.time_utils import format_left as _fmt_left, format_local_time
+
+
+# максимум строк в логе окна
+LOG_MAX_BLOCKS = 5000
+# период сброса буфера лога в виджет, мс
+LOG_FLUSH_MS = 50
+
+
+# ключ params -> (атрибут-виджет, сеттер, приведение типа)
+_PARAM_WIDGETS = (
+    ("trade_type", "trade_type", "setCurrentText", str),
+    ("auto_minutes", "auto_minutes", "setChecked", bool),
+    ("minutes", "minutes", "setValue", int),
+    ("base_investment", "base_investment", "setValue", int),
+    ("max_steps", "max_steps", "setValue", int),
+    ("repeat_count", "repeat_count", "setValue", int),
+    ("min_balance", "min_balance", "setValue", int),
+    ("coefficient", "coefficient", "setValue", float),
+    ("min_percent", "min_percent", "setValue", int),
+    ("double_entry", "double_entry", "setChecked", bool),
+    ("allow_parallel_trades", "parallel_trades", "setChecked", bool),
+    ("use_common_series", "common_series", "setChecked", bool),
+)
+
+_EMPTY: dict = {}
+
+# очередь сигналов: символ, ТФ, статус, время сигнала, след. свеча
+_QUEUE_SORT_KEY = itemgetter(0, 1, 7, 2, 3)
+
+# направление сделки/сигнала и режим счёта -> подпись
+_DIR_TEXT = {1: "ВВЕРХ", 2: "ВНИЗ", -1: "ВНИЗ"}
+_DIR_WORDS = {"UP": "ВВЕРХ", "CALL": "ВВЕРХ", "DOWN": "ВНИЗ", "PUT": "ВНИЗ"}
+_ACCOUNT_TEXT = {True: "ДЕМО", False: "РЕАЛ"}
+
+
+def _fmt_dir(value) -> str:
+    """Направление сигнала из очереди: 1/2/-1, UP/DOWN, CALL/PUT или как есть."""
+    if value is None:
+        return "—"
+    if isinstance(value, int):
+        text = _DIR_TEXT.get(value)
+        if text is not None:
+            return text
+
+    normalized = value
+    if isinstance(value, str):
+        normalized = value.strip()
+        if not normalized:
+            return "—"
+        text = _DIR_WORDS.get(normalized.upper())
+        if text is not None:
+            return text
+
+    try:
+        int_dir = int(normalized)
+    except (TypeError, ValueError):
+        int_dir = None
+    return _DIR_TEXT.get(int_dir) or str(normalized)
+
+
+@dataclass(slots=True)
+class _PendingRow:
+    """Ожидающая сделка в таблице окна (строка = seq - _top_seq)."""
+
+    seq: int
+    expected_end_ts: float
+    indicator: str
+    signal_at: str
+    placed_at: str
+    wait_seconds: float
+    series: str | None = None
+    step: str | None = None
+    left_text: str = ""  # последнее показанное значение отсчёта
+
+# дробные параметры из _collect_params — в логе выводятся через format_amount
+_FLOAT_PARAM_KEYS = frozenset({"coefficient"})
+
+
+def _spin(lo: int, hi: int, value) -> QSpinBox:
+    sb = QSpinBox()
+    sb.setRange(lo, hi)
+    sb.setValue(int(value))
+    return sb
+
+
+def _bold_label(text: str = "") -> QLabel:
+    """QLabel с полужирным шрифтом (через QFont — без движка стилей)."""
+    label = QLabel(text)
+    font = label.font()
+    font.setWeight(QFont.Weight.DemiBold)
+    label.setFont(font)
+    return label
 
 
 class StrategyControlDialog(QWidget):
@@ -52,19 +150,24 @@ class StrategyControlDialog(QWidget):
         self.main = main_window
         self.bot = bot
 
-        # Локальный pending по этому диалогу (по trade_id)
-        self._pending_rows: dict[str, dict] = {}
+        # Локальный pending по этому диалогу (по trade_id).
+        # Строка pending = info.seq - self._top_seq: вставка сверху
+        # только уменьшает _top_seq, записи pending не перебираются.
+        self._pending_rows: dict[str, _PendingRow] = {}
+        self._top_seq = 0
+        # один таймер обратного отсчёта на все pending-строки
+        self._countdown_timer = QTimer(self)
+        self._countdown_timer.setInterval(1000)
+        self._countdown_timer.timeout.connect(self._tick_countdowns)
 
         # ---------- Header ----------
         header = QWidget()
         hh = QHBoxLayout(header)
-        self.lbl_strategy = QLabel(
+        self.lbl_strategy = _bold_label(
             self.main.strategy_label(bot.strategy_kwargs.get("strategy_key", ""))
         )
-        self.lbl_symbol = QLabel(bot.strategy_kwargs.get("symbol", ""))
-        self.lbl_timeframe = QLabel(bot.strategy_kwargs.get("timeframe", ""))
-        for w in (self.lbl_strategy, self.lbl_symbol, self.lbl_timeframe):
-            w.setStyleSheet("font-weight: 600;")
+        self.lbl_symbol = _bold_label(bot.strategy_kwargs.get("symbol", ""))
+        self.lbl_timeframe = _bold_label(bot.strategy_kwargs.get("timeframe", ""))
         hh.addWidget(QLabel("Стратегия:"))
         hh.addWidget(self.lbl_strategy)
         hh.addSpacing(12)
@@ -76,81 +179,68 @@ class StrategyControlDialog(QWidget):
         hh.addStretch(1)
 
         # ---------- ЛОГ (справа) ----------
-        self.log_edit = QTextEdit()
+        # лог — только текст: QPlainTextEdit, старые строки вытесняются сами
+        self.log_edit = QPlainTextEdit()
         self.log_edit.setReadOnly(True)
+        self.log_edit.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.log_edit.setPlaceholderText("Лог этой стратегии…")
         self.log_edit.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
 
-        def _add_log(text: str) -> None:
-            """Добавить строку лога (сверху вниз)."""
-            t = text if str(text).startswith("[") else ts(str(text))
-            self.log_edit.append(t)
-
-        self._add_log = _add_log
-
-        # История старых логов
-        for line in self.main.bot_logs.get(self.bot, []):
-            self._add_log(line)
+        # строки копятся в буфере и выводятся пачкой раз в LOG_FLUSH_MS
+        self._log_buffer: list[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        # История старых логов — одной вставкой в документ, без промежуточных перерисовок
+        history = self.main.bot_logs.get(self.bot)
+        if history:
+            text = "\n".join(t if t.startswith("[") else ts(t) for t in map(str, history))
+            self.log_edit.setUpdatesEnabled(False)
+            try:
+                cursor = self.log_edit.textCursor()
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+                cursor.insertText(text)
+                self.log_edit.setTextCursor(cursor)
+            finally:
+                self.log_edit.setUpdatesEnabled(True)
+            self.log_edit.ensureCursorVisible()
 
         # Подписка на новые логи
         self._log_listener = lambda text: self._add_log(text)
         self.main.bot_log_listeners.setdefault(self.bot, []).append(self._log_listener)
 
         # ---------- ТАБЛИЦА СДЕЛОК (справа) ----------
-        self.trades_table = QTableWidget(self)
-        self.trades_table.setColumnCount(13)
-        self.trades_table.setHorizontalHeaderLabels(
-            [
-                "Время сигнала",  # 0
-                "Время ставки",  # 1
-                "Пара",  # 2
-                "ТФ",  # 3
-                "Серия",  # 4
-                "Шаг",  # 5
-                "Индикатор",  # 6  (если не прилетит — ставим "—")
-                "Направление",  # 7
-                "Ставка",  # 8
-                "Время",  # 9
-                "Процент",  # 10
-                "P/L",  # 11
-                "Счёт",  # 12
-            ]
-        )
+        self.trades_model = TradesModel(self)
+        self.trades_table = QTableView(self)
+        self.trades_table.setModel(self.trades_model)
         hdr = self.trades_table.horizontalHeader()
         hdr.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         hdr.setStretchLastSection(False)
         self.trades_table.setAlternatingRowColors(True)
         self.trades_table.setSortingEnabled(False)
-        self.trades_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.trades_table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        self.trades_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.trades_table.setSelectionMode(QTableView.SelectionMode.NoSelection)
         self.trades_table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
         # ---------- Очередь сигналов ----------
-        self.signal_queue_table = QTableWidget(self)
-        self.signal_queue_table.setColumnCount(7)
-        self.signal_queue_table.setHorizontalHeaderLabels(
-            [
-                "Символ",
-                "ТФ",
-                "Время сигнала",
-                "След. свеча",
-                "Направление",
-                "Индикатор",
-                "Сумма сделки",
-            ]
-        )
+        self.queue_model = SignalQueueModel(self)
+        self.signal_queue_table = QTableView(self)
+        self.signal_queue_table.setModel(self.queue_model)
         qhdr = self.signal_queue_table.horizontalHeader()
         qhdr.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         qhdr.setStretchLastSection(False)
         self.signal_queue_table.setAlternatingRowColors(True)
         self.signal_queue_table.setSortingEnabled(False)
-        self.signal_queue_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.signal_queue_table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        self.signal_queue_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.signal_queue_table.setSelectionMode(QTableView.SelectionMode.NoSelection)
         self.signal_queue_table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
         self._last_queue_snapshot: list[tuple] = []
+        self._last_queue_sig: tuple | None = None
 
         # ---------- Настройки (inline) ----------
         self.settings_box = QGroupBox("Настройки стратегии")
@@ -188,21 +278,9 @@ class StrategyControlDialog(QWidget):
 
         strategy_key = str(self.bot.strategy_kwargs.get("strategy_key", "")).lower()
         self.strategy_key = strategy_key
-        self.minutes = None
         self.auto_minutes = QCheckBox("Авто")
         self.auto_minutes.setChecked(bool(getv("auto_minutes", True)))
 
-        def minutes_row() -> QWidget:
-            row = QWidget()
-            rh = QHBoxLayout(row)
-            rh.setContentsMargins(0, 0, 0, 0)
-            rh.setSpacing(6)
-            if self.minutes:
-                rh.addWidget(self.minutes)
-            rh.addWidget(self.auto_minutes)
-            rh.addStretch(1)
-            return row
-
         # ---- шаблоны ----
         self.templates = load_templates(self.strategy_key)
         template_row = QWidget()
@@ -225,135 +303,37 @@ class StrategyControlDialog(QWidget):
             self.common_series.setChecked(False)
             self.common_series.setEnabled(False)
 
+        # общие для всех стратегий поля
+        self.minutes = _spin(5 if symbol == "BTCUSDT" else 1, 500, default_minutes)
+        self.minutes.setToolTip("1; 3-500 мин; BTCUSDT: 5-500 мин")
+        self.base_investment = _spin(1, 50_000, getv("base_investment", 100))
+        self.repeat_count = _spin(1, 1000, getv("repeat_count", 10))
+        self.min_balance = _spin(1, 10_000_000, getv("min_balance", 100))
+        self.min_percent = _spin(0, 100, getv("min_percent", 70))
+
         if strategy_key in ("oscar_grind_1", "oscar_grind_2"):
-            self.minutes = QSpinBox()
-            self.minutes.setRange(5 if symbol == "BTCUSDT" else 1, 500)
-            self.minutes.setValue(default_minutes)
-            self.minutes.setToolTip("1; 3-500 мин; BTCUSDT: 5-500 мин")
-
-            self.base_investment = QSpinBox()
-            self.base_investment.setRange(1, 50_000)
-            self.base_investment.setValue(int(getv("base_investment", 100)))
-
-
-            self.max_steps = QSpinBox()
-            self.max_steps.setRange(1, 100)
-            self.max_steps.setValue(int(getv("max_steps", 20)))
-
-            self.repeat_count = QSpinBox()
-            self.repeat_count.setRange(1, 1000)
-            self.repeat_count.setValue(int(getv("repeat_count", 10)))
-
-            self.min_balance = QSpinBox()
-            self.min_balance.setRange(1, 10_000_000)
-            self.min_balance.setValue(int(getv("min_balance", 100)))
-
-            self.min_percent = QSpinBox()
-            self.min_percent.setRange(0, 100)
-            self.min_percent.setValue(int(getv("min_percent", 70)))
-
-            self.double_entry = QCheckBox()
-            self.double_entry.setChecked(bool(getv("double_entry", True)))
-            double_entry_label = QLabel("Двойной вход на свечу")
-            double_entry_label.mousePressEvent = lambda event: self.double_entry.toggle()
-
-            form.addRow("Тип торговли", self.trade_type)
-            form.addRow("Базовая ставка", self.base_investment)
-            form.addRow("Время сделки (мин)", minutes_row())
-            form.addRow("Макс. сделок в серии", self.max_steps)
-            form.addRow("Повторов серии", self.repeat_count)
-            form.addRow("Мин. баланс", self.min_balance)
-            form.addRow("Мин. процент", self.min_percent)
-            form.addRow(double_entry_label, self.double_entry)
+            rows = self._build_oscar_form(getv)
         elif strategy_key == "fixed":
-            self.minutes = QSpinBox()
-            self.minutes.setRange(5 if symbol == "BTCUSDT" else 1, 500)
-            self.minutes.setValue(default_minutes)
-            self.minutes.setToolTip("1; 3-500 мин; BTCUSDT: 5-500 мин")
-
-            self.base_investment = QSpinBox()
-            self.base_investment.setRange(1, 50_000)
-            self.base_investment.setValue(int(getv("base_investment", 100)))
-
-            self.repeat_count = QSpinBox()
-            self.repeat_count.setRange(1, 1000)
-            self.repeat_count.setValue(int(getv("repeat_count", 10)))
-
-            self.min_balance = QSpinBox()
-            self.min_balance.setRange(1, 10_000_000)
-            self.min_balance.setValue(int(getv("min_balance", 100)))
-
-            self.min_percent = QSpinBox()
-            self.min_percent.setRange(0, 100)
-            self.min_percent.setValue(int(getv("min_percent", 70)))
-
-            form.addRow("Тип торговли", self.trade_type)
-            form.addRow("Базовая ставка", self.base_investment)
-            form.addRow("Время сделки (мин)", minutes_row())
-            form.addRow("Количество ставок", self.repeat_count)
-            form.addRow("Мин. баланс", self.min_balance)
-            form.addRow("Мин. процент", self.min_percent)
+            rows = self._build_fixed_form(getv)
         else:
-            self.minutes = QSpinBox()
-            self.minutes.setRange(5 if symbol == "BTCUSDT" else 1, 500)
-            self.minutes.setValue(default_minutes)
-            self.minutes.setToolTip("1; 3-500 мин; BTCUSDT: 5-500 мин")
-
-            self.base_investment = QSpinBox()
-            self.base_investment.setRange(1, 50_000)
-            self.base_investment.setValue(int(getv("base_investment", 100)))
-            self.max_steps = QSpinBox()
-            self.max_steps.setRange(1, 20)
-            default_max_steps = 3 if strategy_key == "antimartin" else 5
-            self.max_steps.setValue(int(getv("max_steps", default_max_steps)))
-            self.repeat_count = QSpinBox()
-            self.repeat_count.setRange(1, 1000)
-            self.repeat_count.setValue(int(getv("repeat_count", 10)))
-            self.min_balance = QSpinBox()
-            self.min_balance.setRange(1, 10_000_000)
-            self.min_balance.setValue(int(getv("min_balance", 100)))
-
-            if strategy_key not in ("fibonacci", "fib", "fibo"):
-                self.coefficient = QDoubleSpinBox()
-                self.coefficient.setRange(1.0, 10.0)
-                self.coefficient.setSingleStep(0.1)
-                self.coefficient.setValue(float(getv("coefficient", 2.0)))
-            else:
-                self.coefficient = None
-            self.min_percent = QSpinBox()
-            self.min_percent.setRange(0, 100)
-            self.min_percent.setValue(int(getv("min_percent", 70)))
-
-            form.addRow("Тип торговли", self.trade_type)
-            form.addRow("Базовая ставка", self.base_investment)
-            form.addRow("Время сделки (мин)", minutes_row())
-            form.addRow("Макс. шагов", self.max_steps)
-            form.addRow("Повторов серии", self.repeat_count)
-            form.addRow("Мин. баланс", self.min_balance)
-            if self.coefficient is not None:
-                form.addRow("Коэффициент", self.coefficient)
-            form.addRow("Мин. процент", self.min_percent)
-
-        parallel_label = QLabel("Обрабатывать множество сигналов")
-        parallel_label.mousePressEvent = lambda event: self.parallel_trades.toggle()
-
-        form.addRow(parallel_label, self.parallel_trades)
+            rows = self._build_default_form(getv)
+
+        rows.append(
+            (ClickableLabel("Обрабатывать множество сигналов", self.parallel_trades), self.parallel_trades)
+        )
         if strategy_key != "fixed":
-            common_series_label = QLabel("Общая серия для всех сигналов")
-            common_series_label.mousePressEvent = lambda event: self.common_series.toggle()
-            form.addRow(common_series_label, self.common_series)
-
-        def _update_minutes_enabled(text: str):
-            if self.minutes is not None:
-                self.minutes.setEnabled(text != "classic" and not self.auto_minutes.isChecked())
-
-        self.trade_type.currentTextChanged.connect(_update_minutes_enabled)
-        self.auto_minutes.toggled.connect(
-            lambda checked: self.minutes.setEnabled(
-                self.trade_type.currentText() != "classic" and not checked
+            rows.append(
+                (ClickableLabel("Общая серия для всех сигналов", self.common_series), self.common_series)
             )
-        )
-        _update_minutes_enabled(self.trade_type.currentText())
+        # строки добавляем пачкой — раскладка пересчитается один раз
+        self.settings_box.setUpdatesEnabled(False)
+        for label, field in rows:
+            form.addRow(label, field)
+        self.settings_box.setUpdatesEnabled(True)
+
+        self.trade_type.currentTextChanged.connect(self._update_minutes_enabled)
+        self.auto_minutes.toggled.connect(self._update_minutes_enabled)
+        self._update_minutes_enabled()
 
         # добавить форму после строки шаблонов
         box_v.addLayout(form)
@@ -398,8 +378,7 @@ class StrategyControlDialog(QWidget):
         lv.setSpacing(8)
         lv.addWidget(self.settings_box)
 
-        log_label = QLabel("Лог")
-        log_label.setStyleSheet("font-weight: 600;")
+        log_label = _bold_label("Лог")
         lv.addWidget(log_label)
         lv.addWidget(self.log_edit, 1)
         lv.addWidget(controls)
@@ -412,12 +391,10 @@ class StrategyControlDialog(QWidget):
         rv = QVBoxLayout(right_panel)
         rv.setContentsMargins(0, 0, 0, 0)
         rv.setSpacing(8)
-        trades_label = QLabel("Сделки")
-        trades_label.setStyleSheet("font-weight: 600;")
+        trades_label = _bold_label("Сделки")
         rv.addWidget(trades_label)
         rv.addWidget(self.trades_table)
-        queue_label = QLabel("Очередь сигналов")
-        queue_label.setStyleSheet("font-weight: 600;")
+        queue_label = _bold_label("Очередь сигналов")
         rv.addWidget(queue_label)
         rv.addWidget(self.signal_queue_table)
         rv.setStretch(1, 1)
@@ -436,11 +413,23 @@ class StrategyControlDialog(QWidget):
         layout.addWidget(top_split, stretch=1)
         self.resize(1000, 600)
 
-        # Таймер статуса/кнопок
+        # Кнопки обновляются по событиям бота (add_state_listener);
+        # редкий таймер — подстраховка (удаление бота извне, очередь сигналов).
+        # Работает, только пока окно видно — см. showEvent/hideEvent.
         self.timer = QTimer(self)
-        self.timer.setInterval(200)
+        self.timer.setInterval(1000)
         self.timer.timeout.connect(self._refresh_status_and_buttons)
-        self.timer.start()
+        self.bot.add_state_listener(self._on_bot_state)
+
+        # сеттеры полей по ключу params — только для виджетов этой стратегии
+        self._param_setters: dict[str, tuple] = {}
+        for key, attr, setter, conv in _PARAM_WIDGETS:
+            w = getattr(self, attr, None)
+            if w is not None:
+                self._param_setters[key] = (w, getattr(w, setter), conv)
+        if self.strategy_key == "fixed":
+            # у фиксированной ставки общая серия не настраивается из шаблона
+            self._param_setters.pop("use_common_series", None)
 
         # если у бота есть свои параметры — заполняем поля, но не переобновляем их
         existing_params = self.bot.strategy_kwargs.get("params")
@@ -460,27 +449,125 @@ class StrategyControlDialog(QWidget):
 
         # === Подписка на сделки для КОНКРЕТНОГО бота ===
         # MainWindow будет вызывать наш колбэк, когда у ЭТОГО бота есть pending/result.
+        # (храним связанный метод на себе — в MainWindow на него слабая ссылка)
+        self._trade_handlers = {
+            "pending": self._add_trade_pending_local,
+            "result": self._add_trade_result_local,
+        }
+        # события сделок за один проход цикла событий применяются пачкой
+        self._trade_events: list[tuple[str, dict]] = []
+        self._trade_flush_timer = QTimer(self)
+        self._trade_flush_timer.setSingleShot(True)
+        self._trade_flush_timer.setInterval(0)
+        self._trade_flush_timer.timeout.connect(self._flush_trade_events)
         self._trade_listener = self.handle_trade_event
-        self.main.bot_trade_listeners.setdefault(self.bot, []).append(
-            self._trade_listener
-        )
-        # ВОСПРОИЗВЕСТИ ИСТОРИЮ
-        for kind, payload in self.main.bot_trade_history.get(self.bot, []):
-            try:
-                self.handle_trade_event(kind, payload)
-            except Exception:
-                pass
+        # удалённому боту подписка не нужна: [bot] воссоздал бы запись в defaultdict
+        if self.bot in self.main.bots:
+            self.main.bot_trade_listeners[self.bot].add(self._trade_listener)
+        # ВОСПРОИЗВЕСТИ ИСТОРИЮ — одним сбросом модели вместо вставки по строке
+        history = self.main.bot_trade_history.get(self.bot)
+        if history:
+            with self.trades_model.batch():
+                for kind, rec in history:
+                    try:
+                        self._apply_trade_event(kind, rec._asdict())
+                    except Exception:
+                        pass
+
+    # ---- форма настроек: строки для конкретной стратегии ----
+    def _minutes_row(self) -> QWidget:
+        row = QWidget()
+        rh = QHBoxLayout(row)
+        rh.setContentsMargins(0, 0, 0, 0)
+        rh.setSpacing(6)
+        if self.minutes:
+            rh.addWidget(self.minutes)
+        rh.addWidget(self.auto_minutes)
+        rh.addStretch(1)
+        return row
+
+    def _build_oscar_form(self, getv) -> list[tuple]:
+        self.max_steps = _spin(1, 100, getv("max_steps", 20))
+        self.double_entry = QCheckBox()
+        self.double_entry.setChecked(bool(getv("double_entry", True)))
+        double_entry_label = ClickableLabel("Двойной вход на свечу", self.double_entry)
+        return [
+            ("Тип торговли", self.trade_type),
+            ("Базовая ставка", self.base_investment),
+            ("Время сделки (мин)", self._minutes_row()),
+            ("Макс. сделок в серии", self.max_steps),
+            ("Повторов серии", self.repeat_count),
+            ("Мин. баланс", self.min_balance),
+            ("Мин. процент", self.min_percent),
+            (double_entry_label, self.double_entry),
+        ]
+
+    def _build_fixed_form(self, getv) -> list[tuple]:
+        return [
+            ("Тип торговли", self.trade_type),
+            ("Базовая ставка", self.base_investment),
+            ("Время сделки (мин)", self._minutes_row()),
+            ("Количество ставок", self.repeat_count),
+            ("Мин. баланс", self.min_balance),
+            ("Мин. процент", self.min_percent),
+        ]
+
+    def _build_default_form(self, getv) -> list[tuple]:
+        default_max_steps = 3 if self.strategy_key == "antimartin" else 5
+        self.max_steps = _spin(1, 20, getv("max_steps", default_max_steps))
+        if self.strategy_key not in ("fibonacci", "fib", "fibo"):
+            self.coefficient = QDoubleSpinBox()
+            self.coefficient.setRange(1.0, 10.0)
+            self.coefficient.setSingleStep(0.1)
+            self.coefficient.setValue(float(getv("coefficient", 2.0)))
+        else:
+            self.coefficient = None
+        rows = [
+            ("Тип торговли", self.trade_type),
+            ("Базовая ставка", self.base_investment),
+            ("Время сделки (мин)", self._minutes_row()),
+            ("Макс. шагов", self.max_steps),
+            ("Повторов серии", self.repeat_count),
+            ("Мин. баланс", self.min_balance),
+        ]
+        if self.coefficient is not None:
+            rows.append(("Коэффициент", self.coefficient))
+        rows.append(("Мин. процент", self.min_percent))
+        return rows
+
+    # ---- лог ----
+    def _add_log(self, text: str) -> None:
+        """Добавить строку лога (сверху вниз); вывод — пачкой по таймеру."""
+        t = text if str(text).startswith("[") else ts(str(text))
+        buf = self._log_buffer
+        buf.append(t)
+        if not self.isVisible():
+            # окно скрыто — только копим (не больше, чем вместит лог), вывод в showEvent
+            if len(buf) > LOG_MAX_BLOCKS:
+                del buf[:-LOG_MAX_BLOCKS]
+            return
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        if self._log_buffer:
+            self.log_edit.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     # ---- обработка статуса/кнопок ----
+    def _on_bot_state(self) -> None:
+        # скрытое окно догонит состояние в showEvent
+        if self.isVisible():
+            self._refresh_status_and_buttons()
+
     def _refresh_status_and_buttons(self):
-        bots_now = []
-        try:
-            bots_now = list(self.main.bot_manager.get_all_bots())
-        except Exception:
-            pass
-        bot_exists = self.bot in bots_now
+        # самое дешёвое — строка бота в главном окне; менеджер — только если её нет
+        bot_exists = self.bot in getattr(self.main, "bots", _EMPTY)
         if not bot_exists:
-            bot_exists = self.bot in getattr(self.main, "bot_items", {})
+            try:
+                bot_exists = self.main.bot_manager.has_bot(self.bot)
+            except Exception:
+                bot_exists = False
 
         started = bool(getattr(self.bot, "has_started", lambda: False)())
         running = self.bot.is_running()
@@ -514,11 +601,14 @@ class StrategyControlDialog(QWidget):
             st = self.bot.strategy
             paused = bool(st and hasattr(st, "is_paused") and st.is_paused())
             if not started:
+                self._log_buffer.clear()
                 self.log_edit.clear()
-                self.trades_table.setRowCount(0)
+                self._trade_events.clear()
+                self.trades_model.clear()
                 self._pending_rows.clear()
-                self.signal_queue_table.setRowCount(0)
+                self.queue_model.clear()
                 self._last_queue_snapshot = []
+                self._last_queue_sig = None
                 self.main.bot_logs[self.bot].clear()
                 self.main.bot_trade_history[self.bot].clear()
                 self.main.reset_bot(self.bot)
@@ -636,15 +726,11 @@ class StrategyControlDialog(QWidget):
         if new_params.get("minutes") and self.minutes is not None:
             self.minutes.setValue(int(new_params["minutes"]))
 
-        formatted = []
-        for k, v in new_params.items():
-            if isinstance(v, float):
-                formatted.append(f"'{k}': {format_amount(v)}")
-            else:
-                formatted.append(f"'{k}': {v}")
-        self._add_log(
-            ts("💾 Настройки применены: {" + ", ".join(formatted) + "}")
+        formatted = ", ".join(
+            f"'{k}': {format_amount(v) if k in _FLOAT_PARAM_KEYS else v}"
+            for k, v in new_params.items()
         )
+        self._add_log(ts("💾 Настройки применены: {" + formatted + "}"))
 
     def save_template(self):
         new_params = self._collect_params()
@@ -675,40 +761,27 @@ class StrategyControlDialog(QWidget):
             self.template_combo.setCurrentIndex(idx)
             save_last_template(self.strategy_key, name)
 
+    def _update_minutes_enabled(self, *_):
+        if self.minutes is not None:
+            self.minutes.setEnabled(
+                self.trade_type.currentText() != "classic"
+                and not self.auto_minutes.isChecked()
+            )
+
     def _update_inputs_from_params(self, params: dict[str, object]) -> None:
+        # сигналы полей глушим на время заполнения, зависимое состояние — один раз в конце
+        setters = self._param_setters
+        blockers = []
         for k, v in params.items():
-            if k == "trade_type":
-                self.trade_type.setCurrentText(str(v))
-            elif k == "auto_minutes" and hasattr(self, "auto_minutes"):
-                self.auto_minutes.setChecked(bool(v))
-            elif k == "minutes" and self.minutes is not None:
-                self.minutes.setValue(int(v))
-            elif k == "base_investment" and hasattr(self, "base_investment"):
-                self.base_investment.setValue(int(v))
-            elif k == "max_steps" and hasattr(self, "max_steps"):
-                self.max_steps.setValue(int(v))
-            elif k == "repeat_count" and hasattr(self, "repeat_count"):
-                self.repeat_count.setValue(int(v))
-            elif k == "min_balance" and hasattr(self, "min_balance"):
-                self.min_balance.setValue(int(v))
-            elif (
-                k == "coefficient"
-                and hasattr(self, "coefficient")
-                and self.coefficient is not None
-            ):
-                self.coefficient.setValue(float(v))
-            elif k == "min_percent" and hasattr(self, "min_percent"):
-                self.min_percent.setValue(int(v))
-            elif k == "double_entry" and hasattr(self, "double_entry"):
-                self.double_entry.setChecked(bool(v))
-            elif k == "allow_parallel_trades" and hasattr(self, "parallel_trades"):
-                self.parallel_trades.setChecked(bool(v))
-            elif (
-                k == "use_common_series"
-                and hasattr(self, "common_series")
-                and self.strategy_key != "fixed"
-            ):
-                self.common_series.setChecked(bool(v))
+            entry = setters.get(k)
+            if entry is not None:
+                widget, setter, conv = entry
+                blockers.append(QSignalBlocker(widget))
+                setter(conv(v))
+        if blockers:
+            for b in blockers:
+                b.unblock()
+            self._update_minutes_enabled()
 
     def apply_template(self):
         idx = self.template_combo.currentIndex()
@@ -721,13 +794,13 @@ class StrategyControlDialog(QWidget):
         save_last_template(self.strategy_key, str(tmpl.get("name", "")))
 
     # ---- хелперы: локальная таблица сделок ----
-    def _fmt_money(self, value: float, ccy: str) -> str:
-        # простенький формат (знаки +/−/— handled снаружи)
+    def _fmt_money(self, value: float, ccy: str, show_plus: bool = False) -> str:
+        # format_money кэширует строки по сумме в копейках — ставки повторяются
         try:
             v = float(value)
         except Exception:
             v = 0.0
-        return format_money(v, ccy)
+        return format_money(v, ccy, show_plus=show_plus)
 
     def _add_trade_pending_local(
         self,
@@ -751,36 +824,17 @@ class StrategyControlDialog(QWidget):
         Добавляем жёлтую строку с обратным отсчётом в ПРАВОЙ таблице диалога.
         Отсчёт синхронизирован по expected_end_ts, чтобы не «прыгало» при открытии окна.
         """
-        from time import time as _now
-
         if expected_end_ts is None:
             expected_end_ts = _now() + float(wait_seconds)
 
-        def _fmt_left(sec: float) -> str:
-            s = int(max(0, round(sec)))
-            h, r = divmod(s, 3600)
-            m, s = divmod(r, 60)
-            if h > 0:
-                return f"{h}:{m:02d}:{s:02d}"
-            if m > 0:
-                return f"{m}:{s:02d}"
-            return f"{s} с"
-
-        was_sort = self.trades_table.isSortingEnabled()
-        if was_sort:
-            self.trades_table.setSortingEnabled(False)
-
-        row = 0
-        self.trades_table.insertRow(row)
-
-        dir_text = "ВВЕРХ" if int(direction) == 1 else "ВНИЗ"
+        dir_text = _DIR_TEXT.get(direction) or ("ВВЕРХ" if int(direction) == 1 else "ВНИЗ")
         left_now = max(0.0, expected_end_ts - _now())
-        account_txt = account_mode or (
-            "ДЕМО" if getattr(self.main, "is_demo", False) else "РЕАЛ"
-        )
+        account_txt = account_mode or _ACCOUNT_TEXT[bool(getattr(self.main, "is_demo", False))]
         ccy = getattr(self.main, "account_currency", "RUB")
         ind_txt = indicator or "—"
         duration_txt = f"{int(round(float(wait_seconds) / 60))} мин"
+        left_text = _fmt_left(left_now)
+        pl_text = f"Ожидание ({left_text})"
 
         vals = [
             signal_at,  # 0 Время сигнала
@@ -794,71 +848,48 @@ class StrategyControlDialog(QWidget):
             self._fmt_money(stake, ccy),  # 8 Ставка
             duration_txt,  # 9 Время
             f"{percent}%",  # 10 %
-            f"Ожидание ({_fmt_left(left_now)})",  # 11 P/L
+            pl_text,  # 11 P/L
             account_txt,  # 12 Счёт
         ]
-        for col, v in enumerate(vals):
-            it = QTableWidgetItem(str(v))
-            if col in (7, 11):
-                it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.trades_table.setItem(row, col, it)
-
-        yellow = QBrush(QColor("#fff4c2"))
-        for c in range(self.trades_table.columnCount()):
-            it = self.trades_table.item(row, c)
-            if it:
-                it.setBackground(yellow)
-
-        timer = QTimer(self)
-        timer.setInterval(1000)
-
-        def _tick():
-            left = expected_end_ts - _now()
-            info = self._pending_rows.get(trade_id)
-            if not info:
-                timer.stop()
-                return
-            cur_row = info.get("row")
-            if not isinstance(cur_row, int) or cur_row >= self.trades_table.rowCount():
-                timer.stop()
-                return
-            item = self.trades_table.item(cur_row, 11)
-            if item:
-                item.setText(f"Ожидание ({_fmt_left(left)})")
-            if left <= 0:
-                timer.stop()
-
-        timer.timeout.connect(_tick)
-        timer.start()
+        self.trades_model.insert_row(0, vals, TradesModel.STATE_PENDING)
+        self._top_seq -= 1
 
         # сохраним pending, чтобы потом обновить по result
-        prev = self._pending_rows.pop(trade_id, None)
-        if prev and isinstance(prev.get("timer"), QTimer):
-            try:
-                prev["timer"].stop()
-            except Exception:
-                pass
-
-        # сдвинем индексы ранее вставленных строк
+        # (повтор того же trade_id просто перезаписывает запись)
+        self._pending_rows[trade_id] = _PendingRow(
+            seq=self._top_seq,
+            expected_end_ts=float(expected_end_ts),
+            indicator=ind_txt,
+            signal_at=signal_at,
+            placed_at=placed_at,
+            wait_seconds=float(wait_seconds),
+            series=series,
+            step=step,
+            left_text=left_text,
+        )
+        if self.isVisible() and not self._countdown_timer.isActive():
+            self._countdown_timer.start()
+
+    def _tick_countdowns(self) -> None:
+        """Раз в секунду обновляет ячейку P/L у всех ожидающих сделок."""
+        now = _now()
+        n_rows = self.trades_model.rowCount()
+        top = self._top_seq
+        active = False
         for info in self._pending_rows.values():
-            r = info.get("row")
-            if isinstance(r, int) and r >= row:
-                info["row"] = r + 1
-
-        self._pending_rows[trade_id] = {
-            "row": row,
-            "timer": timer,
-            "expected_end_ts": float(expected_end_ts),
-            "indicator": ind_txt,
-            "signal_at": signal_at,
-            "placed_at": placed_at,
-            "wait_seconds": float(wait_seconds),
-            "series": series,
-            "step": step,
-        }
-
-        if was_sort:
-            self.trades_table.setSortingEnabled(True)
+            row = info.seq - top
+            if row >= n_rows:
+                continue
+            left = info.expected_end_ts - now
+            if left > 0:
+                active = True
+            text = _fmt_left(left)
+            if text == info.left_text:
+                continue  # в пределах той же секунды — ячейку не трогаем
+            info.left_text = text
+            self.trades_model.set_text(row, TradesModel.COL_PL, f"Ожидание ({text})")
+        if not active:
+            self._countdown_timer.stop()
 
     def _add_trade_result_local(
         self,
@@ -881,12 +912,6 @@ class StrategyControlDialog(QWidget):
         Обновляем/добавляем зелёную/красную/серую строку по результату.
         """
 
-        def fmt_pl(p, ccy):
-            if p is None:
-                return "—"
-            txt = self._fmt_money(p, ccy)
-            return "+" + txt if p > 0 else txt
-
         # найти существующую строку по trade_id (если была pending)
         row_to_update = None
         ind_txt = indicator or "—"
@@ -896,40 +921,19 @@ class StrategyControlDialog(QWidget):
         series_txt = series or "—"
         step_txt = step or "—"
         if trade_id and trade_id in self._pending_rows:
-            info = self._pending_rows.pop(trade_id, {})
-            timer = info.get("timer")
-            if isinstance(timer, QTimer):
-                try:
-                    timer.stop()
-                except Exception:
-                    pass
-            row = info.get("row")
-            if isinstance(row, int) and 0 <= row < self.trades_table.rowCount():
+            info = self._pending_rows.pop(trade_id)
+            row = info.seq - self._top_seq
+            if 0 <= row < self.trades_model.rowCount():
                 row_to_update = row
-                ind_txt = info.get("indicator", ind_txt)
-                sig_time = info.get("signal_at", sig_time)
-                place_time = info.get("placed_at", place_time)
-                duration_txt = f"{int(round(info.get('wait_seconds', 0.0) / 60))} мин"
-                series_txt = info.get("series", series_txt) or "—"
-                step_txt = info.get("step", step_txt) or "—"
-
-        was_sort = self.trades_table.isSortingEnabled()
-        if was_sort:
-            self.trades_table.setSortingEnabled(False)
-
-        if row_to_update is None:
-            row_to_update = 0
-            self.trades_table.insertRow(row_to_update)
-            # сдвинем индексы pending'ов, т.к. вставили строку сверху
-            for info in self._pending_rows.values():
-                r = info.get("row")
-                if isinstance(r, int) and r >= row_to_update:
-                    info["row"] = r + 1
-
-        dir_text = "ВВЕРХ" if int(direction) == 1 else "ВНИЗ"
-        account_txt = account_mode or (
-            "ДЕМО" if getattr(self.main, "is_demo", False) else "РЕАЛ"
-        )
+                ind_txt = info.indicator
+                sig_time = info.signal_at
+                place_time = info.placed_at
+                duration_txt = f"{int(round(info.wait_seconds / 60))} мин"
+                series_txt = info.series or "—"
+                step_txt = info.step or "—"
+
+        dir_text = _DIR_TEXT.get(direction) or ("ВВЕРХ" if int(direction) == 1 else "ВНИЗ")
+        account_txt = account_mode or _ACCOUNT_TEXT[bool(getattr(self.main, "is_demo", False))]
         ccy = getattr(self.main, "account_currency", "RUB")
 
         vals = [
@@ -944,29 +948,21 @@ class StrategyControlDialog(QWidget):
             self._fmt_money(stake, ccy),  # 8
             duration_txt,  # 9
             f"{percent}%",  # 10
-            fmt_pl(profit, ccy),  # 11
+            "—" if profit is None else self._fmt_money(profit, ccy, True),  # 11
             account_txt,  # 12
         ]
-        for col, v in enumerate(vals):
-            item = QTableWidgetItem(str(v))
-            if col in (7, 11):
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.trades_table.setItem(row_to_update, col, item)
-
         if profit is None or abs(profit) < 1e-9:
-            color = QColor("#e0e0e0")
+            state = TradesModel.STATE_NEUTRAL
         elif profit > 0:
-            color = QColor("#d1f7c4")
+            state = TradesModel.STATE_WIN
         else:
-            color = QColor("#ffd6d6")
-        brush = QBrush(color)
-        for c in range(self.trades_table.columnCount()):
-            it = self.trades_table.item(row_to_update, c)
-            if it:
-                it.setBackground(brush)
+            state = TradesModel.STATE_LOSS
 
-        if was_sort:
-            self.trades_table.setSortingEnabled(True)
+        if row_to_update is None:
+            self.trades_model.insert_row(0, vals, state)
+            self._top_seq -= 1  # pending'и сдвинулись вниз
+        else:
+            self.trades_model.set_row(row_to_update, vals, state)
 
     # ---- публичный колбэк для MainWindow ----
     def handle_trade_event(self, kind: str, payload: dict):
@@ -975,14 +971,31 @@ class StrategyControlDialog(QWidget):
         payload: dict с полями, как у MainWindow.add_trade_pending/add_trade_result,
                  расширенно допускаем 'indicator'
         """
+        if kind not in self._trade_handlers:
+            return
+        self._trade_events.append((kind, payload))
+        if not self._trade_flush_timer.isActive():
+            self._trade_flush_timer.start()
+
+    def _flush_trade_events(self) -> None:
+        """Применяет накопленные события; всплеск из нескольких — одним сбросом модели."""
+        events, self._trade_events = self._trade_events, []
+        if len(events) == 1:
+            self._apply_trade_event(*events[0])
+            return
+        with self.trades_model.batch():
+            for kind, payload in events:
+                self._apply_trade_event(kind, payload)
+
+    def _apply_trade_event(self, kind: str, payload: dict) -> None:
+        handler = self._trade_handlers.get(kind)
+        if handler is None:
+            return
         data = dict(payload)
         data.pop("strategy", None)  # в этом диалоге нет колонки "Стратегия"
 
         try:
-            if kind == "pending":
-                self._add_trade_pending_local(**data)
-            else:
-                self._add_trade_result_local(**data)
+            handler(**data)
         except Exception as e:
             # пусть ошибка в UI не роняет окно
             self._add_log(ts(f"⚠ Ошибка обновления таблицы сделок: {e}"))
@@ -998,7 +1011,6 @@ class StrategyControlDialog(QWidget):
         if common is None:
             return []
 
-        snapshot: list[tuple[str, str, str, str, str, str, str, str]] = []
         ccy = getattr(strategy, "_anchor_ccy", getattr(strategy, "params", {}).get("account_currency", "RUB"))
 
         def _planned_amount(trade_key: str) -> str:
@@ -1023,113 +1035,124 @@ class StrategyControlDialog(QWidget):
                     pass
             return str(value) if value is not None else "—"
 
-        def _fmt_dir(value) -> str:
-            if value is None:
-                return "—"
-
-            normalized = value
-            if isinstance(value, str):
-                normalized = value.strip()
-                if not normalized:
-                    return "—"
-                upper = normalized.upper()
-                if upper in {"UP", "CALL"}:
-                    return "ВВЕРХ"
-                if upper in {"DOWN", "PUT"}:
-                    return "ВНИЗ"
-
-            try:
-                int_dir = int(normalized)
-            except (TypeError, ValueError):
-                int_dir = None
-
-            if int_dir == 1:
-                return "ВВЕРХ"
-            if int_dir in (-1, 2):
-                return "ВНИЗ"
-
-            return str(normalized)
-
-        def _extract(items: dict, status: str) -> None:
+        def _extract(items: dict, status: str) -> Iterator[tuple]:
             if not isinstance(items, dict):
                 return
             for trade_key, queue in items.items():
                 if queue is None:
                     continue
                 raw = getattr(queue, "_queue", None)
-                try:
-                    entries = list(raw) if raw is not None else [None] * queue.qsize()
-                except Exception:
-                    entries = []
+                if raw is None:
+                    entries = (None,) * queue.qsize()
+                elif not raw:
+                    continue
+                else:
+                    # deque живёт в потоке стратегии: берём копию одним вызовом,
+                    # а не итерируем на месте
+                    try:
+                        entries = tuple(raw)
+                    except RuntimeError:  # очередь изменилась во время копирования
+                        continue
                 if not entries:
                     continue
                 if "_" in trade_key:
                     symbol, timeframe = trade_key.split("_", 1)
                 else:
                     symbol, timeframe = trade_key, "—"
+                symbol, timeframe = str(symbol), str(timeframe)
+                amount = _planned_amount(trade_key)  # одна на ключ, не на сигнал
                 for payload in entries:
-                    data = payload or {}
-                    timestamp = _fmt_dt(data.get("timestamp")) if isinstance(data, dict) else "—"
-                    next_expire = _fmt_dt(data.get("next_expire")) if isinstance(data, dict) else "—"
-                    indicator = "—"
-                    direction = "—"
-                    if isinstance(data, dict):
-                        indicator = str(data.get("indicator") or "—")
-                        direction = _fmt_dir(data.get("direction"))
-                    amount = _planned_amount(trade_key)
-                    snapshot.append(
-                        (
-                            str(symbol),
-                            str(timeframe),
-                            timestamp,
-                            next_expire,
-                            direction,
-                            indicator,
+                    if isinstance(payload, dict):
+                        yield (
+                            symbol,
+                            timeframe,
+                            _fmt_dt(payload.get("timestamp")),
+                            _fmt_dt(payload.get("next_expire")),
+                            _fmt_dir(payload.get("direction")),
+                            str(payload.get("indicator") or "—"),
                             amount,
                             status,
                         )
-                    )
-
-        _extract(getattr(common, "_signal_queues", {}), "в очереди")
-        _extract(getattr(common, "_pending_signals", {}), "отложен")
+                    else:
+                        yield (symbol, timeframe, "—", "—", "—", "—", amount, status)
+
+        # оба источника — одним потоком прямо в sorted, без промежуточного списка
+        return sorted(
+            chain(
+                _extract(getattr(common, "_signal_queues", {}), "в очереди"),
+                _extract(getattr(common, "_pending_signals", {}), "отложен"),
+            ),
+            key=_QUEUE_SORT_KEY,
+        )
 
-        snapshot.sort(key=lambda item: (item[0], item[1], item[7], item[2], item[3]))
-        return snapshot
+    def _signal_queue_sig(self) -> tuple:
+        """
+        Дешёвая подпись очередей: ключ, длина, крайние сигналы и плановая ставка.
+        Совпала с прошлой — снимок (форматирование + сортировка) не пересобираем.
+        Подпись держит сами объекты сигналов (не id): пока они живы, их адрес
+        не достанется новому сигналу, а сравнение идёт по `is`/==.
+        """
+        strategy = getattr(self.bot, "strategy", None)
+        common = getattr(strategy, "_common", None)
+        if common is None:
+            return ()
+        getter = getattr(strategy, "get_planned_stake", None)
+        params = getattr(strategy, "params", {})
+        sig = [strategy, params.get("base_investment"), params.get("account_currency")]
+        for items in (
+            getattr(common, "_signal_queues", {}),
+            getattr(common, "_pending_signals", {}),
+        ):
+            if not isinstance(items, dict):
+                continue
+            for trade_key, queue in items.items():
+                if queue is None:
+                    continue
+                planned = getter(trade_key) if callable(getter) else None
+                raw = getattr(queue, "_queue", None)
+                if raw is None:
+                    # содержимое не видно — в таблице только количество строк
+                    sig.append((trade_key, queue.qsize(), planned))
+                elif not raw:
+                    sig.append((trade_key, 0))
+                else:
+                    try:
+                        first, last = raw[0], raw[-1]
+                    except IndexError:  # очередь опустела между проверкой и чтением
+                        first = last = None
+                    sig.append((trade_key, len(raw), first, last, planned))
+            sig.append(None)  # граница между очередями и отложенными
+        return tuple(sig)
 
     def _refresh_signal_queue_table(self) -> None:
+        sig = self._signal_queue_sig()
+        if sig == self._last_queue_sig:
+            return
+        self._last_queue_sig = sig
         snapshot = self._collect_signal_queue_snapshot()
         if snapshot == self._last_queue_snapshot:
             return
         self._last_queue_snapshot = snapshot
+        self.queue_model.set_rows(snapshot)
 
-        was_sorting = self.signal_queue_table.isSortingEnabled()
-        if was_sorting:
-            self.signal_queue_table.setSortingEnabled(False)
-
-        self.signal_queue_table.setRowCount(len(snapshot))
-        for row, row_data in enumerate(snapshot):
-            values = row_data[:-1]
-            status = row_data[-1]
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(str(value))
-                if col == 4:
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                item.setToolTip(f"Статус: {status}")
-                self.signal_queue_table.setItem(row, col, item)
-
-            if status != "в очереди":
-                for col in range(len(values)):
-                    item = self.signal_queue_table.item(row, col)
-                    if not item:
-                        continue
-                    font = QFont(item.font())
-                    font.setItalic(True)
-                    item.setFont(font)
+    # ---- жизнь/смерть окна ----
+    def showEvent(self, e):
+        super().showEvent(e)
+        # пока окно было скрыто, таймеры стояли — догоняем состояние
+        self._flush_log()
+        self._refresh_status_and_buttons()
+        self.timer.start()
+        if self._pending_rows:
+            self._countdown_timer.start()
+            self._tick_countdowns()  # сам остановит таймер, если ждать нечего
 
-        if was_sorting:
-            self.signal_queue_table.setSortingEnabled(True)
+    def hideEvent(self, e):
+        # скрытое/свёрнутое окно не обновляем
+        self.timer.stop()
+        self._countdown_timer.stop()
+        self._log_flush_timer.stop()
+        super().hideEvent(e)
 
-    # ---- жизнь/смерть окна ----
     def closeEvent(self, e):
         # убрать лог-листенер
         listeners = self.main.bot_log_listeners.get(self.bot, [])
@@ -1139,22 +1162,21 @@ class StrategyControlDialog(QWidget):
             except Exception:
                 pass
 
+        self._log_flush_timer.stop()
+        self._log_buffer.clear()
+        self._trade_flush_timer.stop()
+        self._trade_events.clear()
+        self._last_queue_sig = None  # отпускаем ссылки на сигналы и стратегию
+
+        self.bot.remove_state_listener(self._on_bot_state)
+
         # убрать подписку на сделки
-        tlst = self.main.bot_trade_listeners.get(self.bot, [])
-        if self._trade_listener in tlst:
-            try:
-                tlst.remove(self._trade_listener)
-            except Exception:
-                pass
+        tlst = self.main.bot_trade_listeners.get(self.bot)
+        if tlst is not None:
+            tlst.discard(self._trade_listener)
 
-        # остановить локальные таймеры ожиданий
-        for info in list(self._pending_rows.values()):
-            t = info.get("timer")
-            if isinstance(t, QTimer):
-                try:
-                    t.stop()
-                except Exception:
-                    pass
+        # остановить обратный отсчёт ожиданий
+        self._countdown_timer.stop()
         self._pending_rows.clear()
 
         super().closeEvent(e)
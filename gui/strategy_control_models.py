@@ -0,0 +1,241 @@
+# gui/strategy_control_models.py
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor, QFont
+
+
+class TradesModel(QAbstractTableModel):
+    """
+    Модель таблицы сделок окна стратегии.
+    Строка — список из 13 готовых строк + состояние строки (задаёт фон).
+    Новые строки вставляются сверху (индекс 0).
+    """
+
+    COLS = [
+        "Время сигнала",  # 0
+        "Время ставки",  # 1
+        "Пара",  # 2
+        "ТФ",  # 3
+        "Серия",  # 4
+        "Шаг",  # 5
+        "Индикатор",  # 6  (если не прилетит — ставим "—")
+        "Направление",  # 7
+        "Ставка",  # 8
+        "Время",  # 9
+        "Процент",  # 10
+        "P/L",  # 11
+        "Счёт",  # 12
+    ]
+    COL_PL = 11
+    _CENTER_COLS = frozenset((7, 11))
+
+    # состояние строки -> фон (кисти общие для всех строк и окон)
+    STATE_PENDING, STATE_WIN, STATE_LOSS, STATE_NEUTRAL = range(4)
+    _BRUSHES = (
+        QBrush(QColor("#fff4c2")),  # ожидание
+        QBrush(QColor("#d1f7c4")),  # плюс
+        QBrush(QColor("#ffd6d6")),  # минус
+        QBrush(QColor("#e0e0e0")),  # ноль / нет данных
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[list[str]] = []
+        self._row_state: list[int] = []
+        self._batch = False
+
+    # ---- QAbstractTableModel ----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._BRUSHES[self._row_state[index.row()]]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() in self._CENTER_COLS:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLS[section]
+        return super().headerData(section, orientation, role)
+
+    # ---- изменение ----
+    @contextmanager
+    def batch(self):
+        """
+        Пакетное изменение (например, воспроизведение истории):
+        внутри insert_row/set_row/set_text только меняют списки,
+        вью получает один сброс модели в конце.
+        """
+        if self._batch:
+            yield
+            return
+        self.beginResetModel()
+        self._batch = True
+        try:
+            yield
+        finally:
+            self._batch = False
+            self.endResetModel()
+
+    def insert_row(self, r: int, values: list, state: int) -> None:
+        if self._batch:
+            self._rows.insert(r, [str(v) for v in values])
+            self._row_state.insert(r, state)
+            return
+        self.beginInsertRows(QModelIndex(), r, r)
+        self._rows.insert(r, [str(v) for v in values])
+        self._row_state.insert(r, state)
+        self.endInsertRows()
+
+    def set_row(self, r: int, values: list, state: int) -> None:
+        """
+        Обновляет строку на месте (pending -> результат): список ячеек не
+        пересоздаётся, вью получает только диапазон реально изменившихся колонок.
+        """
+        row = self._rows[r]
+        first = last = -1
+        for c, v in enumerate(values):
+            text = str(v)
+            if row[c] != text:
+                row[c] = text
+                if first < 0:
+                    first = c
+                last = c
+        if self._row_state[r] != state:
+            self._row_state[r] = state
+            first, last = 0, len(self.COLS) - 1  # сменился фон — вся строка
+        if self._batch or first < 0:
+            return
+        self.dataChanged.emit(self.index(r, first), self.index(r, last))
+
+    def set_text(self, r: int, col: int, text: str) -> None:
+        """Меняет одну ячейку — перерисовывается только она."""
+        row = self._rows[r]
+        if row[col] == text:
+            return
+        row[col] = text
+        if self._batch:
+            return
+        idx = self.index(r, col)
+        self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DisplayRole])
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows.clear()
+        self._row_state.clear()
+        self.endResetModel()
+
+
+class SignalQueueModel(QAbstractTableModel):
+    """
+    Модель очереди сигналов.
+    Строка — кортеж снимка: 7 отображаемых значений + статус последним элементом.
+    """
+
+    COLS = [
+        "Символ",
+        "ТФ",
+        "Время сигнала",
+        "След. свеча",
+        "Направление",
+        "Индикатор",
+        "Сумма сделки",
+    ]
+    STATUS_QUEUED = "в очереди"
+
+    _italic: QFont | None = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple] = []
+
+    @classmethod
+    def _italic_font(cls) -> QFont:
+        # QFont нельзя создавать до QApplication — берём лениво
+        if cls._italic is None:
+            f = QFont()
+            f.setItalic(True)
+            cls._italic = f
+        return cls._italic
+
+    # ---- QAbstractTableModel ----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(row[index.column()])
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"Статус: {row[-1]}"
+        if role == Qt.ItemDataRole.FontRole and row[-1] != self.STATUS_QUEUED:
+            return self._italic_font()
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == 4:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLS[section]
+        return super().headerData(section, orientation, role)
+
+    # ---- изменение ----
+    def set_rows(self, rows: list[tuple]) -> None:
+        """
+        Применяет новый снимок, трогая только изменившийся участок:
+        общие начало и конец (снимок отсортирован) остаются как есть,
+        середина обновляется на месте, лишнее удаляется/недостающее вставляется.
+        """
+        old = self._rows
+        new = list(rows)
+        n_old, n_new = len(old), len(new)
+        limit = min(n_old, n_new)
+        p = 0
+        while p < limit and old[p] == new[p]:
+            p += 1
+        q = 0
+        while q < limit - p and old[n_old - 1 - q] == new[n_new - 1 - q]:
+            q += 1
+        if p == n_old == n_new:
+            return
+
+        old_mid = n_old - p - q
+        new_mid = n_new - p - q
+        common = min(old_mid, new_mid)
+        if common:
+            old[p : p + common] = new[p : p + common]
+            self.dataChanged.emit(
+                self.index(p, 0), self.index(p + common - 1, len(self.COLS) - 1)
+            )
+        start = p + common
+        if old_mid > common:
+            self.beginRemoveRows(QModelIndex(), start, p + old_mid - 1)
+            del old[start : p + old_mid]
+            self.endRemoveRows()
+        elif new_mid > common:
+            self.beginInsertRows(QModelIndex(), start, p + new_mid - 1)
+            old[start:start] = new[start : p + new_mid]
+            self.endInsertRows()
+
+    def clear(self) -> None:
+        if self._rows:
+            self.beginResetModel()
+            self._rows = []
+            self.endResetModel()
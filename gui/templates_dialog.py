@@ -11,7 +11,7 @@ from PyQt6.QtWidgets import (
     QInputDialog,
     QDialogButtonBox,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker
 from typing import List, Dict
 
 from core.templates import load_templates, save_templates
@@ -106,6 +106,14 @@ class TemplatesDialog(QDialog):
     def _default_name(self) -> str:
         return f"Шаблон {len(self.templates) + 1}"
 
+    def _move_item(self, src: int, dst: int) -> None:
+        """Переставляет строку списка, не пересобирая его и открытые настройки."""
+        blocker = QSignalBlocker(self.list_widget)
+        item = self.list_widget.takeItem(src)
+        self.list_widget.insertItem(dst, item)
+        self.list_widget.setCurrentRow(dst)
+        blocker.unblock()
+
     def _show_template_settings(self, row: int) -> None:
         while self.settings_layout.count():
             item = self.settings_layout.takeAt(0)
@@ -126,6 +134,10 @@ class TemplatesDialog(QDialog):
         params.setdefault("timeframe", "M1")
         params.setdefault("symbol", "")
         widget = dlg_cls(params, parent=self)
+        # окна с ленивой сборкой — строим сразу, чтобы спрятать кнопки
+        ensure_ui = getattr(widget, "_ensure_ui", None)
+        if callable(ensure_ui):
+            ensure_ui()
         btn_box = widget.findChild(QDialogButtonBox)
         if btn_box:
             btn_box.setVisible(False)
@@ -147,7 +159,7 @@ class TemplatesDialog(QDialog):
         if ok and name:
             self.templates.append({"name": name, "params": {}})
             self._save()
-            self._load_templates(self._current_strategy())
+            self.list_widget.addItem(name)
             self.list_widget.setCurrentRow(len(self.templates) - 1)
 
     def _rename_template(self) -> None:
@@ -161,8 +173,7 @@ class TemplatesDialog(QDialog):
         if ok and name:
             tmpl["name"] = name
             self._save()
-            self._load_templates(self._current_strategy())
-            self.list_widget.setCurrentRow(row)
+            self.list_widget.item(row).setText(name)
 
     def _delete_template(self) -> None:
         row = self.list_widget.currentRow()
@@ -170,7 +181,13 @@ class TemplatesDialog(QDialog):
             return
         del self.templates[row]
         self._save()
-        self._load_templates(self._current_strategy())
+        blocker = QSignalBlocker(self.list_widget)
+        self.list_widget.takeItem(row)
+        new_row = min(row, self.list_widget.count() - 1)
+        self.list_widget.setCurrentRow(new_row)
+        blocker.unblock()
+        # сигналы были заблокированы — форму обновляем сами (-1 очищает её)
+        self._show_template_settings(new_row)
 
     def _move_up(self) -> None:
         row = self.list_widget.currentRow()
@@ -181,8 +198,7 @@ class TemplatesDialog(QDialog):
             self.templates[row - 1],
         )
         self._save()
-        self._load_templates(self._current_strategy())
-        self.list_widget.setCurrentRow(row - 1)
+        self._move_item(row, row - 1)
 
     def _move_down(self) -> None:
         row = self.list_widget.currentRow()
@@ -193,6 +209,5 @@ class TemplatesDialog(QDialog):
             self.templates[row + 1],
         )
         self._save()
-        self._load_templates(self._current_strategy())
-        self.list_widget.setCurrentRow(row + 1)
+        self._move_item(row, row + 1)
 
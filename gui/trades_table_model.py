@@ -0,0 +1,103 @@
+# gui/trades_table_model.py
+from __future__ import annotations
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush
+
+
+class TradesTableModel(QAbstractTableModel):
+    """
+    Модель таблицы сделок главного окна.
+    Новые сделки показываются сверху, но в памяти лежат в конце списка:
+    строка вью r <-> индекс хранения len(rows) - 1 - r.
+    Добавление сделки — append, индексы хранения уже добавленных строк не меняются.
+    """
+
+    COLS = [
+        "Время сигнала",
+        "Время ставки",
+        "Стратегия",
+        "Серия",
+        "Шаг",
+        "Индикатор",
+        "Валютная пара",
+        "ТФ",
+        "Направление",
+        "Ставка",
+        "Время",
+        "Процент",
+        "P/L",
+        "Счет",
+    ]
+    COL_PL = 12
+    # по центру: Направление, P/L
+    _CENTER_COLS = frozenset((8, 12))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[list[str]] = []
+        self._bg: list[QBrush | None] = []
+
+    # ---- QAbstractTableModel ----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[len(self._rows) - 1 - index.row()][index.column()]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._bg[len(self._rows) - 1 - index.row()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() in self._CENTER_COLS:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLS[section]
+        return super().headerData(section, orientation, role)
+
+    # ---- изменение (по индексу хранения) ----
+    def view_row(self, key: int) -> int:
+        """Строка во вью для индекса хранения."""
+        return len(self._rows) - 1 - key
+
+    def prepend(self, values: list, bg: QBrush | None = None) -> int:
+        """Добавляет строку сверху и возвращает её индекс хранения."""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.append([str(v) for v in values])
+        self._bg.append(bg)
+        self.endInsertRows()
+        return len(self._rows) - 1
+
+    def set_text(self, key: int, col: int, text: str) -> None:
+        """Меняет одну ячейку — перерисовывается только она."""
+        row = self._rows[key]
+        if row[col] == text:
+            return
+        row[col] = text
+        idx = self.index(self.view_row(key), col)
+        self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DisplayRole])
+
+    def set_background(self, key: int, bg: QBrush | None) -> None:
+        self._bg[key] = bg
+        r = self.view_row(key)
+        self.dataChanged.emit(
+            self.index(r, 0),
+            self.index(r, len(self.COLS) - 1),
+            [Qt.ItemDataRole.BackgroundRole],
+        )
+
+    def remove(self, key: int) -> None:
+        """Удаляет строку; индексы хранения выше key сдвигаются на один вниз."""
+        if not 0 <= key < len(self._rows):
+            return
+        r = self.view_row(key)
+        self.beginRemoveRows(QModelIndex(), r, r)
+        del self._rows[key]
+        del self._bg[key]
+        self.endRemoveRows()
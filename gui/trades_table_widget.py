@@ -1,14 +1,38 @@
 # gui/trades_table_widget.py
 from __future__ import annotations
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
+
+from dataclasses import dataclass
+from time import time as _now
+
+from PyQt6.QtWidgets import QTableView, QHeaderView
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QColor, QBrush
 from core.money import format_amount, format_money
+from core.time_utils import format_left
+from gui.trades_table_model import TradesTableModel
+
+# фоны строк: ожидание / плюс / минус / ноль — создаются один раз
+_BRUSH_YELLOW = QBrush(QColor("#fff4c2"))
+_BRUSH_GREEN = QBrush(QColor(200, 255, 200))
+_BRUSH_RED = QBrush(QColor(255, 215, 215))
+_BRUSH_GREY = QBrush(QColor(230, 230, 230))
+
+_COL_PL = TradesTableModel.COL_PL
+_DIR_TEXT = {1: "ВВЕРХ", 2: "ВНИЗ", -1: "ВНИЗ"}
 
 
-class TradesTableWidget(QTableWidget):
+@dataclass(slots=True)
+class _PendingRow:
+    """Ожидающая сделка: дедлайн отсчёта и подписи серии/шага."""
+
+    expected_end_ts: float
+    series: str | None = None
+    step: str | None = None
+
+
+class TradesTableWidget(QTableView):
     """
-    Таблица сделок.
+    Таблица сделок (вью над TradesTableModel).
     Колонки:
       [0] Время сигнала
       [1] Время ставки
@@ -26,27 +50,12 @@ class TradesTableWidget(QTableWidget):
       [13] Счёт
     """
 
-    COLS = [
-        "Время сигнала",
-        "Время ставки",
-        "Стратегия",
-        "Серия",
-        "Шаг",
-        "Индикатор",
-        "Валютная пара",
-        "ТФ",
-        "Направление",
-        "Ставка",
-        "Время",
-        "Процент",
-        "P/L",
-        "Счет",
-    ]
+    COLS = TradesTableModel.COLS
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setColumnCount(len(self.COLS))
-        self.setHorizontalHeaderLabels(self.COLS)
+        self.trades_model = TradesTableModel(self)
+        self.setModel(self.trades_model)
 
         hdr = self.horizontalHeader()
         hdr.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
@@ -54,13 +63,20 @@ class TradesTableWidget(QTableWidget):
 
         self.setAlternatingRowColors(True)
         self.setSortingEnabled(False)
-        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(QTableView.SelectionMode.NoSelection)
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        # trade_id -> row
+        # trade_id -> индекс хранения в модели (не меняется при добавлении сверху)
         self._row_by_trade: dict[str, int] = {}
-        # ожидание (trade_id -> {row, timer, expected_end_ts})
-        self._pending_rows: dict[str, dict] = {}
+        # ожидание (trade_id -> _PendingRow)
+        self._pending_rows: dict[str, _PendingRow] = {}
+        # один таймер обратного отсчёта на все строки ожидания
+        self._countdown_timer = QTimer(self)
+        self._countdown_timer.setInterval(1000)
+        self._countdown_timer.timeout.connect(self._tick_all)
+
+    def has_trade(self, trade_id: str) -> bool:
+        return trade_id in self._row_by_trade
 
     def add_pending(
         self,
@@ -81,26 +97,11 @@ class TradesTableWidget(QTableWidget):
         currency: str | None = None,
         step: str | None = None,
     ):
-        """Добавляет строку ожидания с таймером."""
-        from time import time as _now
-
-        row = 0
-        self.insertRow(row)
-
+        """Добавляет строку ожидания с обратным отсчётом (тикает общий таймер)."""
         if expected_end_ts is None:
             expected_end_ts = _now() + float(duration)
 
-        def _fmt_left(sec: float) -> str:
-            s = int(max(0, round(sec)))
-            h, r = divmod(s, 3600)
-            m, s = divmod(r, 60)
-            if h > 0:
-                return f"{h}:{m:02d}:{s:02d}"
-            if m > 0:
-                return f"{m}:{s:02d}"
-            return f"{s} с"
-
-        dir_text = "ВВЕРХ" if int(direction) == 1 else "ВНИЗ"
+        dir_text = _DIR_TEXT.get(direction) or ("ВВЕРХ" if int(direction) == 1 else "ВНИЗ")
         left_now = max(0.0, expected_end_ts - _now())
         if currency:
             stake_txt = format_money(stake, currency)
@@ -120,130 +121,76 @@ class TradesTableWidget(QTableWidget):
             stake_txt,
             f"{int(round(duration / 60))} мин",
             f"{percent}%",
-            f"Ожидание ({_fmt_left(left_now)})",
+            f"Ожидание ({format_left(left_now)})",
             account_mode,
         ]
-        for col, val in enumerate(values):
-            it = QTableWidgetItem(str(val))
-            if col in (8, 12):  # выравнивание Направление, P/L по центру
-                it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, col, it)
-
-        yellow = QBrush(QColor("#fff4c2"))
-        for c in range(self.columnCount()):
-            it = self.item(row, c)
-            if it:
-                it.setBackground(yellow)
-
-        timer = QTimer(self)
-        timer.setInterval(1000)
-
-        def _tick():
-            left = expected_end_ts - _now()
-            info = self._pending_rows.get(trade_id)
-            if not info:
-                timer.stop()
-                return
-            cur_row = info.get("row")
-            if not isinstance(cur_row, int) or cur_row >= self.rowCount():
-                timer.stop()
-                return
-            item = self.item(cur_row, 12)
-            if item:
-                item.setText(f"Ожидание ({_fmt_left(left)})")
+        # сверху во вью, в конец списка модели — одна вставка строки
+        self._row_by_trade[trade_id] = self.trades_model.prepend(values, _BRUSH_YELLOW)
+        self._pending_rows[trade_id] = _PendingRow(
+            float(expected_end_ts), series, step
+        )
+        if not self._countdown_timer.isActive():
+            self._countdown_timer.start()
+
+    def _tick_all(self) -> None:
+        """Раз в секунду обновляет отсчёт у всех ожидающих сделок разом."""
+        now = _now()
+        model = self.trades_model
+        row_by_trade = self._row_by_trade
+        expired = []
+        for tid, info in self._pending_rows.items():
+            key = row_by_trade.get(tid)
+            if key is None:
+                continue
+            left = info.expected_end_ts - now
+            model.set_text(key, _COL_PL, f"Ожидание ({format_left(left)})")
             if left <= 0:
-                timer.stop()
-
-        timer.timeout.connect(_tick)
-        timer.start()
-
-        # сдвигаем индексы ранее вставленных (мы вставили сверху)
-        self._row_by_trade = {
-            tid: (r + 1 if r >= row else r) for tid, r in self._row_by_trade.items()
-        }
-        for info in self._pending_rows.values():
-            r = info.get("row")
-            if isinstance(r, int) and r >= row:
-                info["row"] = r + 1
-        self._row_by_trade[trade_id] = row
-        self._pending_rows[trade_id] = {
-            "row": row,
-            "timer": timer,
-            "expected_end_ts": float(expected_end_ts),
-            "series": series,
-            "step": step,
-        }
+                expired.append(tid)
+        # отсчёт дошёл до нуля — строка ждёт результат, тикать её больше незачем
+        for tid in expired:
+            self._pending_rows.pop(tid, None)
+        if not self._pending_rows:
+            self._countdown_timer.stop()
 
     def set_result(
         self, trade_id: str, profit: float | None, currency: str = "",
     ):
-        info = self._pending_rows.pop(trade_id, None)
-        if info:
-            timer = info.get("timer")
-            if isinstance(timer, QTimer):
-                try:
-                    timer.stop()
-                except Exception:
-                    pass
-
-        if trade_id not in self._row_by_trade:
-            return
-        row = self._row_by_trade[trade_id]
+        self._pending_rows.pop(trade_id, None)
 
-        pl_item = self.item(row, 12)
-        if pl_item is None:
-            pl_item = QTableWidgetItem()
-            pl_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 12, pl_item)
+        key = self._row_by_trade.get(trade_id)
+        if key is None:
+            return
+        model = self.trades_model
 
         if profit is None:
-            pl_item.setText("неизв.")
+            model.set_text(key, _COL_PL, "неизв.")
             return
 
         if currency:
             text = format_money(profit, currency, show_plus=True)
         else:
             text = format_amount(profit, show_plus=True)
-        pl_item.setText(text)
+        model.set_text(key, _COL_PL, text)
 
         # лёгкая подсветка всей строки
         if profit > 0:
-            row_bg = QColor(200, 255, 200)
+            row_bg = _BRUSH_GREEN
         elif abs(profit) < 1e-9:
-            row_bg = QColor(230, 230, 230)
+            row_bg = _BRUSH_GREY
         else:
-            row_bg = QColor(255, 215, 215)
-
-        for c in range(self.columnCount()):
-            it = self.item(row, c)
-            if it:
-                it.setBackground(QBrush(row_bg))
+            row_bg = _BRUSH_RED
+        model.set_background(key, row_bg)
 
     def remove_trade(self, trade_id: str):
         """Удаляет сделку из таблицы по её идентификатору."""
-        info = self._pending_rows.pop(trade_id, None)
-        if info:
-            timer = info.get("timer")
-            if isinstance(timer, QTimer):
-                try:
-                    timer.stop()
-                except Exception:
-                    pass
-
-        row = self._row_by_trade.pop(trade_id, None)
-        if row is None:
+        self._pending_rows.pop(trade_id, None)
+
+        key = self._row_by_trade.pop(trade_id, None)
+        if key is None:
             return
-        if 0 <= row < self.rowCount():
-            self.removeRow(row)
-
-        # пересчитываем индексы после удаления строки
-        self._row_by_trade = {
-            tid: (r - 1 if r > row else r) for tid, r in self._row_by_trade.items()
-        }
-        for info in self._pending_rows.values():
-            r = info.get("row")
-            if isinstance(r, int):
-                if r == row:
-                    info["row"] = None
-                elif r > row:
-                    info["row"] = r - 1
+        self.trades_model.remove(key)
+
+        # сделки новее удалённой сдвинулись в списке модели на один — правим только их
+        for tid, k in self._row_by_trade.items():
+            if k > key:
+                self._row_by_trade[tid] = k - 1
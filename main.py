@@ -3,15 +3,11 @@ import asyncio
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QTimer
 from qasync import QEventLoop
 
-try:
-    import qdarktheme
-except Exception:  # pragma: no cover - optional dependency
-    qdarktheme = None
-
-from gui.main_window import MainWindow
 from core import config
+from gui._theme import apply_theme
 
 
 def run_gui() -> None:
@@ -21,29 +17,17 @@ def run_gui() -> None:
     # ----------------------------
     # ТЕМА
     # ----------------------------
+    # системная палитра дешёвая — сразу; таблица стилей qdarktheme — после показа окна
     theme = config.get_theme()
-    if qdarktheme and theme in ("light", "dark"):
-        if hasattr(qdarktheme, "setup_theme"):
-            qdarktheme.setup_theme(theme)
-        elif hasattr(qdarktheme, "load_stylesheet"):
-            app.setStyleSheet(qdarktheme.load_stylesheet(theme))
-    else:
-        app.setPalette(app.style().standardPalette())
-        app.setStyleSheet("")
+    deferred_theme = theme in ("light", "dark")
+    if not deferred_theme:
+        apply_theme(app, theme)
 
     # ----------------------------
     # ШРИФТ (Calibri по умолчанию)
     # ----------------------------
-    font = QFont("Calibri", 10)
-
-    font_family = config.get_font_family()
-    font_size = config.get_font_size()
-
-    if font_family:
-        font.setFamily(font_family)
-    if font_size:
-        font.setPointSize(font_size)
-
+    # один QFont сразу с итоговыми семейством и размером
+    font = QFont(config.get_font_family() or "Calibri", config.get_font_size() or 10)
     app.setFont(font)
 
     # ----------------------------
@@ -55,8 +39,13 @@ def run_gui() -> None:
     # ----------------------------
     # GUI
     # ----------------------------
+    # весь GUI + стратегии грузим только после создания QApplication
+    from gui.main_window import MainWindow
+
     window = MainWindow()
     window.show()
+    if deferred_theme:
+        QTimer.singleShot(0, lambda: apply_theme(app, theme))
 
     # asyncio.create_task(run_server())
 
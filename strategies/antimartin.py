@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
 
 from strategies.base_trading_strategy import BaseTradingStrategy
@@ -26,7 +27,8 @@ from strategies.log_messages import (
     series_remaining,
 )
 
-ANTIMARTINGALE_DEFAULTS = {
+# только для чтения: стратегия берёт себе копию в __init__
+ANTIMARTINGALE_DEFAULTS = MappingProxyType({
     "base_investment": 100,
     "max_steps": 3,
     "repeat_count": 10,
@@ -39,7 +41,7 @@ ANTIMARTINGALE_DEFAULTS = {
     "grace_delay_sec": 30.0,
     "trade_type": "classic",
     "allow_parallel_trades": False,
-}
+})
 
 
 class AntiMartingaleStrategy(BaseTradingStrategy):
@@ -53,6 +55,9 @@ class AntiMartingaleStrategy(BaseTradingStrategy):
     - Устаревший сигнал НЕ завершает серию
     """
 
+    # своё поле — в слоте; базовые классы слотов не объявляют (__dict__ остаётся)
+    __slots__ = ("_active_series",)
+
     def __init__(
         self,
         http_client,
@@ -65,9 +70,7 @@ class AntiMartingaleStrategy(BaseTradingStrategy):
         params: Optional[dict] = None,
         **kwargs,
     ):
-        merged = dict(ANTIMARTINGALE_DEFAULTS)
-        if params:
-            merged.update(params)
+        merged = {**ANTIMARTINGALE_DEFAULTS, **(params or {})}
 
         super().__init__(
             http_client=http_client,
@@ -81,21 +84,21 @@ class AntiMartingaleStrategy(BaseTradingStrategy):
             **kwargs,
         )
 
-        self._active_series: dict[str, bool] = {}
+        self._active_series: set[str] = set()  # trade_key с идущей серией
 
     # ======================================================================
     # Required by StrategyCommon
     # ======================================================================
 
     def is_series_active(self, trade_key: str) -> bool:
-        return self._active_series.get(trade_key, False)
+        return trade_key in self._active_series
 
     # ======================================================================
     # Signal processing
     # ======================================================================
 
     async def _process_single_signal(self, signal_data: dict) -> None:
-        log = self.log or (lambda s: None)
+        log = self._log
 
         # --- обновляем контекст сигнала ---
         ctx = refresh_signal_context(
@@ -113,7 +116,7 @@ class AntiMartingaleStrategy(BaseTradingStrategy):
         self._maybe_set_auto_minutes(timeframe)
 
         # --- если серия активна — сигнал уходит в pending ---
-        if self._active_series.get(trade_key):
+        if trade_key in self._active_series:
             log(series_already_active(symbol, timeframe))
             common = getattr(self, "_common", None)
             if common:
@@ -127,7 +130,7 @@ class AntiMartingaleStrategy(BaseTradingStrategy):
             return
 
         # --- старт серии ---
-        self._active_series[trade_key] = True
+        self._active_series.add(trade_key)
         log(start_processing(symbol, "Антимартингейл"))
 
         try:
@@ -143,7 +146,7 @@ class AntiMartingaleStrategy(BaseTradingStrategy):
             self._set_series_left(trade_key, updated_left)
 
         finally:
-            self._active_series.pop(trade_key, None)
+            self._active_series.discard(trade_key)
             log(series_completed(symbol, timeframe, "Антимартингейл"))
 
     # ======================================================================
@@ -163,6 +166,11 @@ class AntiMartingaleStrategy(BaseTradingStrategy):
     ) -> int:
         max_steps = int(self.params.get("max_steps", 3))
         base_stake = float(self.params.get("base_investment", 100))
+        # числовые параметры на всю серию — читаем один раз, не на каждом шаге
+        # (_trade_type/_anchor_ccy/_use_any_* меняет update_params на ходу — их читаем по месту)
+        signal_timeout = float(self.params.get("signal_timeout_sec", 30))
+        min_pct = int(self.params.get("min_percent", 70))
+        wait_low = float(self.params.get("wait_on_low_percent", 1))
 
         step = 0
         stake = base_stake
@@ -172,26 +180,28 @@ class AntiMartingaleStrategy(BaseTradingStrategy):
 
         series_label = self.format_series_label(trade_key, series_left=series_left)
 
+        async def _next_signal() -> Optional[tuple[str, str, int, dict]]:
+            """Ждёт новый сигнал и обновляет контекст; None — не дождались."""
+            new_signal = await wait_for_new_signal(self, trade_key, timeout=signal_timeout)
+            if not new_signal:
+                return None
+            ctx = refresh_signal_context(
+                self,
+                new_signal,
+                update_symbol=self._use_any_symbol,
+                update_timeframe=self._use_any_timeframe,
+            )
+            self._maybe_set_auto_minutes(ctx.timeframe)
+            return ctx.symbol, ctx.timeframe, ctx.direction, new_signal
+
         while self._running and step < max_steps:
             await self._pause_point()
 
             if need_new_signal:
-                timeout = float(self.params.get("signal_timeout_sec", 30))
-                new_signal = await wait_for_new_signal(self, trade_key, timeout=timeout)
-                if not new_signal:
+                nxt = await _next_signal()
+                if nxt is None:
                     return series_left
-
-                ctx = refresh_signal_context(
-                    self,
-                    new_signal,
-                    update_symbol=self._use_any_symbol,
-                    update_timeframe=self._use_any_timeframe,
-                )
-                symbol = ctx.symbol
-                timeframe = ctx.timeframe
-                direction = ctx.direction
-                signal_data = new_signal
-                self._maybe_set_auto_minutes(timeframe)
+                symbol, timeframe, direction, signal_data = nxt
                 need_new_signal = False
 
             # --- проверка аккаунта ---
@@ -209,30 +219,18 @@ class AntiMartingaleStrategy(BaseTradingStrategy):
 
             if not ok:
                 log(signal_not_actual_for_placement(symbol, reason))
-                timeout = float(self.params.get("signal_timeout_sec", 30))
-                new_signal = await wait_for_new_signal(self, trade_key, timeout=timeout)
-                if not new_signal:
+                nxt = await _next_signal()
+                if nxt is None:
                     return series_left
-
-                ctx = refresh_signal_context(
-                    self,
-                    new_signal,
-                    update_symbol=self._use_any_symbol,
-                    update_timeframe=self._use_any_timeframe,
-                )
-                symbol = ctx.symbol
-                timeframe = ctx.timeframe
-                direction = ctx.direction
-                signal_data = new_signal
-                self._maybe_set_auto_minutes(timeframe)
+                symbol, timeframe, direction, signal_data = nxt
                 continue
 
             # --- payout + balance ---
             pct, _ = await self.check_payout_and_balance(
                 symbol=symbol,
                 stake=stake,
-                min_pct=int(self.params.get("min_percent", 70)),
-                wait_low=float(self.params.get("wait_on_low_percent", 1)),
+                min_pct=min_pct,
+                wait_low=wait_low,
             )
             if pct is None:
                 continue
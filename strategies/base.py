@@ -6,6 +6,11 @@ from strategies.log_messages import params_updated, signal_queue_error
 if TYPE_CHECKING:
     from core.http_async import HttpClient
 
+
+def _noop_log(_msg) -> None:
+    """Заглушка лога, когда log_callback не передан."""
+
+
 class StrategyBase:
     """
     Абстрактная база для стратегий - управление жизненным циклом и сигналами.
@@ -19,6 +24,8 @@ class StrategyBase:
         self.user_hash = user_hash
         self.symbol = symbol
         self.log = log_callback
+        # всегда вызываемый лог: без проверки self.log и лямбды на каждый сигнал
+        self._log = log_callback if callable(log_callback) else _noop_log
         self.params = params  # живой dict
         self.timeframe = self.params.get("timeframe", "M1")
         self._running = False
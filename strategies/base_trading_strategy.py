@@ -466,7 +466,7 @@ class BaseTradingStrategy(StrategyBase):
         account_ccy: str,
         max_attempts: int = 4,
     ) -> Optional[str]:
-        log = self.log or (lambda s: None)
+        log = self._log
 
         trade_kwargs: dict[str, Any] = {"trade_type": self._trade_type}
         time_arg: Any = self._trade_minutes
@@ -646,7 +646,7 @@ class BaseTradingStrategy(StrategyBase):
         if pct < min_pct:
             self._status("ожидание высокого процента")
             if not self._low_payout_notified:
-                (self.log or (lambda s: None))(
+                self._log(
                     f"[{symbol}] ℹ Низкий payout {pct}% < {min_pct}% — ждём..."
                 )
                 self._low_payout_notified = True
@@ -654,7 +654,7 @@ class BaseTradingStrategy(StrategyBase):
             return None, None
 
         if self._low_payout_notified:
-            (self.log or (lambda s: None))(
+            self._log(
                 f"[{symbol}] ℹ Работа продолжается (текущий payout = {pct}%)"
             )
             self._low_payout_notified = False
@@ -668,7 +668,7 @@ class BaseTradingStrategy(StrategyBase):
 
         min_floor = float(self.params.get("min_balance", 100))
         if cur_balance is None or (cur_balance - stake) < min_floor:
-            (self.log or (lambda s: None))(
+            self._log(
                 f"[{symbol}] 🛑 Сделка {format_amount(stake)} {account_ccy} может опустить баланс ниже "
                 f"{format_amount(min_floor)} {account_ccy}"
                 + (
@@ -743,7 +743,7 @@ class BaseTradingStrategy(StrategyBase):
         grace = float(self.params.get("grace_delay_sec", 30.0))
 
         def _on_delay(sec: float):
-            (self.log or (lambda s: None))(
+            self._log(
                 f"[{self.symbol}] ⏱ Задержка следующего прогноза ~{sec:.1f}s"
             )
 
@@ -822,7 +822,7 @@ class BaseTradingStrategy(StrategyBase):
             await self._shutdown()
 
     async def _initialize_account(self) -> None:
-        log = self.log or (lambda s: None)
+        log = self._log
 
         try:
             self._anchor_is_demo = await is_demo_account(self.http_client)
@@ -862,7 +862,7 @@ class BaseTradingStrategy(StrategyBase):
         self._active_trades.clear()
         self._pending_for_status.clear()
 
-        (self.log or (lambda s: None))(strategy_shutdown(self.symbol, self.strategy_name))
+        self._log(strategy_shutdown(self.symbol, self.strategy_name))
 
     def stop(self) -> None:
         self._stop_when_idle_requested = False
@@ -109,7 +109,7 @@ class FibonacciStrategy(BaseTradingStrategy):
         return True
 
     async def _process_single_signal(self, signal_data: dict) -> None:
-        log = self.log or (lambda s: None)
+        log = self._log
 
         symbol = signal_data["symbol"]
         timeframe = signal_data["timeframe"]
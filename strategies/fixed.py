@@ -141,7 +141,7 @@ class FixedStakeStrategy(BaseTradingStrategy):
     # =====================================================================
 
     async def _process_single_signal(self, signal_data: dict) -> None:
-        log = self.log or (lambda s: None)
+        log = self._log
 
         symbol = signal_data["symbol"]
         timeframe = signal_data["timeframe"]
@@ -405,7 +405,7 @@ class FixedStakeStrategy(BaseTradingStrategy):
     # =====================================================================
 
     def stop(self) -> None:
-        log = self.log or (lambda s: None)
+        log = self._log
         log(fixed_stake_stopped(self.symbol, self._placed_trades_total))
         super().stop()
         self._active_trade.clear()
@@ -149,7 +149,7 @@ class MartingaleStrategy(BaseTradingStrategy):
         return self._active_series.get(trade_key, False)
 
     async def _process_single_signal(self, signal_data: dict) -> None:
-        log = self.log or (lambda s: None)
+        log = self._log
 
         symbol = signal_data["symbol"]
         timeframe = signal_data["timeframe"]
@@ -47,7 +47,7 @@ class OscarGrind1Strategy(OscarGrindStrategy):
         profit: float,
         cum_profit: float,
     ) -> float:
-        log = self.log or (lambda s: None)
+        log = self._log
 
         if outcome == "win":
             next_stake = float(stake) + float(base_unit)
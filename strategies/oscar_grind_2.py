@@ -51,7 +51,7 @@ class OscarGrind2Strategy(OscarGrindStrategy):
         profit: float,
         cum_profit: float,
     ) -> float:
-        log = self.log or (lambda s: None)
+        log = self._log
 
         k = float(pct) / 100.0
 
@@ -101,7 +101,7 @@ class OscarGrindStrategy(BaseTradingStrategy):
     # =====================================================================
 
     async def _process_single_signal(self, signal_data: dict) -> None:
-        log = self.log or (lambda s: None)
+        log = self._log
 
         symbol = signal_data["symbol"]
         timeframe = signal_data["timeframe"]
@@ -44,7 +44,7 @@ class StrategyCommon:
 
     def __init__(self, strategy_instance):
         self.strategy = strategy_instance
-        self.log = strategy_instance.log or (lambda s: None)
+        self.log = strategy_instance._log
         self._trade_in_progress = False
 
         self._signal_queues: Dict[str, asyncio.Queue] = {}
@@ -1,7 +1,10 @@
 # strategies/timeframe_utils.py
 from __future__ import annotations
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=64)
 def minutes_from_timeframe(tf: str) -> int:
     """Конвертация таймфрейма в минуты (M1/H1/D1/W1)."""
     if not tf: